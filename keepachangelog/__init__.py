@@ -1,3 +1,62 @@
 from keepachangelog.version import __version__
-from keepachangelog._changelog import to_dict, to_raw_dict, release, from_dict
-from keepachangelog._versioning import to_sorted_semantic
+
+# Same as typing.TYPE_CHECKING (understood by type checkers), without importing typing
+TYPE_CHECKING = False
+
+# Public API is only imported once used, to keep import (and command line) fast
+_public_api = {
+    "to_dict": "keepachangelog._changelog",
+    "bytes_to_dict": "keepachangelog._changelog",
+    "to_raw_dict": "keepachangelog._changelog",
+    "find_raw_release": "keepachangelog._changelog",
+    "release": "keepachangelog._changelog",
+    "from_dict": "keepachangelog._changelog",
+    "write_dict": "keepachangelog._changelog",
+    "iter_releases": "keepachangelog._changelog",
+    "iter_raw_releases": "keepachangelog._changelog",
+    "to_sorted_semantic": "keepachangelog._versioning",
+    "SemanticVersion": "keepachangelog._versioning",
+    "VersionIndex": "keepachangelog._versioning",
+    "Changelog": "keepachangelog._memoized",
+    "IncrementalParser": "keepachangelog._incremental",
+    "release_many": "keepachangelog._batch",
+    "parallel_to_dict": "keepachangelog._batch",
+}
+
+__all__ = ["__version__", *_public_api]
+
+if TYPE_CHECKING:  # pragma: no cover
+    from keepachangelog._changelog import (
+        to_dict,
+        bytes_to_dict,
+        to_raw_dict,
+        find_raw_release,
+        release,
+        from_dict,
+        write_dict,
+        iter_releases,
+        iter_raw_releases,
+    )
+    from keepachangelog._versioning import (
+        to_sorted_semantic,
+        SemanticVersion,
+        VersionIndex,
+    )
+    from keepachangelog._memoized import Changelog
+    from keepachangelog._incremental import IncrementalParser
+    from keepachangelog._batch import release_many, parallel_to_dict
+
+
+def __getattr__(name: str):
+    if name not in _public_api:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # __import__ is used as importlib is not imported on interpreter startup
+    value = getattr(__import__(_public_api[name], fromlist=[name]), name)
+    # Further access will not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_public_api})
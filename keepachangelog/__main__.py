@@ -1,18 +1,60 @@
 import sys
 import argparse
+import signal
 
 import keepachangelog
+from keepachangelog._client import forward
 from keepachangelog.version import __version__
 
 
 def _command_show(args: argparse.Namespace) -> None:
-    changelog = keepachangelog.to_raw_dict(args.file)
-    content = changelog.get(args.release)
-    print(content["raw"])
+    content = args.changelogs.find_raw_release(args.file, args.release)
+    if not content:
+        sys.stderr.write(f"{args.release} cannot be found in {args.file}.")
+        exit(2)
+
+    print(content.get("raw", ""))
+
+
+def _command_since(args: argparse.Namespace) -> None:
+    for current_release in keepachangelog.iter_raw_releases(
+        args.file, since=args.release
+    ):
+        metadata = current_release["metadata"]
+        # Provide each release as soon as it is read
+        print(f"## [{metadata['version']}] - {metadata['release_date']}")
+        print(current_release.get("raw", ""), flush=True)
+
+
+def _command_versions(args: argparse.Namespace) -> None:
+    for version in args.changelogs.to_dict(args.file):
+        print(version)
+
+
+def _command_serve(args: argparse.Namespace) -> None:
+    if args.changelogs is not keepachangelog:
+        sys.stderr.write("serve cannot be requested to a running server.")
+        exit(2)
+
+    # Unix sockets are not available on every platform
+    from keepachangelog._server import Server
+
+    # Stop serving (and remove the socket) when terminated
+    previous_handler = signal.signal(signal.SIGTERM, lambda *_: exit(0))
+    try:
+        with Server(args.socket) as server:
+            print(f"Serving on {args.socket}", flush=True)
+            server.serve_forever()
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
 
 
 def _command_release(args: argparse.Namespace) -> None:
-    new_version = keepachangelog.release(args.file, args.release)
+    if args.all:
+        _release_all(args)
+        return
+
+    new_version = keepachangelog.release(args.file, args.release, lock=args.lock)
 
     if not new_version:
         sys.stderr.write(
@@ -23,6 +65,36 @@ def _command_release(args: argparse.Namespace) -> None:
     print(new_version)
 
 
+def _release_all(args: argparse.Namespace) -> None:
+    # Only needed to release several changelogs, avoid importing it for every command
+    import glob
+
+    changelog_paths = sorted(glob.glob(args.all, recursive=True))
+    if not changelog_paths:
+        sys.stderr.write(f"No changelog matches {args.all}.")
+        exit(2)
+
+    released, unchanged, failed = 0, 0, 0
+    for changelog_path, new_version in keepachangelog.release_many(
+        changelog_paths, args.release, lock=args.lock
+    ).items():
+        if isinstance(new_version, Exception):
+            sys.stderr.write(
+                f"{changelog_path}: {type(new_version).__name__}: {new_version}\n"
+            )
+            failed += 1
+        elif new_version:
+            print(f"{changelog_path}: {new_version}")
+            released += 1
+        else:
+            print(f"{changelog_path}: nothing to release")
+            unchanged += 1
+
+    print(f"{released} released, {unchanged} unchanged, {failed} failed.")
+    if failed:
+        exit(2)
+
+
 def _parse_args(command_line: list[str]) -> argparse.Namespace:
     class CustomFormatter(
         argparse.ArgumentDefaultsHelpFormatter, argparse.RawDescriptionHelpFormatter
@@ -38,9 +110,19 @@ Examples:
     keepachangelog show 1.0.0
     keepachangelog show 1.0.0 path/to/CHANGELOG.md
 
+    keepachangelog since 1.0.0
+    keepachangelog since 1.0.0 path/to/CHANGELOG.md
+
     keepachangelog release
     keepachangelog release 1.0.1
     keepachangelog release 1.0.1 -f path/to/CHANGELOG.md
+    keepachangelog release --lock
+    keepachangelog release --all "packages/*/CHANGELOG.md"
+
+    keepachangelog versions
+    keepachangelog versions path/to/CHANGELOG.md
+
+    keepachangelog serve --socket /tmp/keepachangelog.sock
 """,
         formatter_class=CustomFormatter,
     )
@@ -67,6 +149,28 @@ Examples:
 
     parser_show.set_defaults(func=_command_show)
 
+    # keepachangelog since
+    parser_since_help = "Show the content of the releases more recent than a version"
+    parser_since: argparse.ArgumentParser = subparser.add_parser(
+        "since", description=parser_since_help, help=parser_since_help
+    )
+    parser_since.formatter_class = CustomFormatter
+
+    parser_since.add_argument(
+        "release",
+        type=str,
+        help="The version to start from (the changelog is only read up to this release)",
+    )
+    parser_since.add_argument(
+        "file",
+        type=str,
+        nargs="?",
+        default="CHANGELOG.md",
+        help="The path to the changelog file",
+    )
+
+    parser_since.set_defaults(func=_command_since)
+
     # keepachangelog release
     parser_release_help = "Create a new release in the changelog"
     parser_release: argparse.ArgumentParser = subparser.add_parser(
@@ -88,9 +192,56 @@ Examples:
         default="CHANGELOG.md",
         help="The path to the changelog file",
     )
+    parser_release.add_argument(
+        "--lock",
+        action="store_true",
+        help="Wait for other locked releases of the same changelog to be over (lock is held on a .lock file next to the changelog)",
+    )
+
+    parser_release.add_argument(
+        "--all",
+        type=str,
+        metavar="GLOB",
+        help="Release every changelog matching this pattern (** matches any directory), in parallel, instead of a single file",
+    )
 
     parser_release.set_defaults(func=_command_release)
 
+    # keepachangelog versions
+    parser_versions_help = "List the versions of the changelog"
+    parser_versions: argparse.ArgumentParser = subparser.add_parser(
+        "versions", description=parser_versions_help, help=parser_versions_help
+    )
+    parser_versions.formatter_class = CustomFormatter
+
+    parser_versions.add_argument(
+        "file",
+        type=str,
+        nargs="?",
+        default="CHANGELOG.md",
+        help="The path to the changelog file",
+    )
+
+    parser_versions.set_defaults(func=_command_versions)
+
+    # keepachangelog serve
+    parser_serve_help = (
+        "Keep changelogs in memory to answer commands sent over a Unix socket"
+    )
+    parser_serve: argparse.ArgumentParser = subparser.add_parser(
+        "serve", description=parser_serve_help, help=parser_serve_help
+    )
+    parser_serve.formatter_class = CustomFormatter
+
+    parser_serve.add_argument(
+        "--socket",
+        type=str,
+        required=True,
+        help="The path to the Unix socket to listen on. Set KEEPACHANGELOG_SOCKET environment variable to this path for commands to be sent to this server",
+    )
+
+    parser_serve.set_defaults(func=_command_serve)
+
     parser.add_argument(
         "-v", "--version", action="version", version=f"%(prog)s {__version__}"
     )
@@ -98,8 +249,21 @@ Examples:
     return parser.parse_args(command_line)
 
 
-def main(command_line: list[str] = None) -> None:
+def main(command_line: list[str] = None, *, server=None) -> None:
+    if command_line is None:
+        command_line = sys.argv[1:]
+
+    # Avoid starting a new process if a server is running
+    if not server and command_line[:1] != ["serve"]:
+        exit_code = forward(command_line)
+        if exit_code is not None:
+            if exit_code:
+                exit(exit_code)
+            return
+
     args = _parse_args(command_line)
+    # Changelogs are kept in memory by the server
+    args.changelogs = server or keepachangelog
     args.func(args)
 
 
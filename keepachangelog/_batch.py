@@ -0,0 +1,133 @@
+import itertools
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Union
+
+from keepachangelog._changelog import (
+    bytes_to_dict,
+    release,
+    to_dict,
+    _add_urls,
+    _parse_lines,
+)
+from keepachangelog._incremental import release_start_pattern
+
+# Smaller changelogs are faster to parse than to send to other processes
+min_chunk_size = 4 * 1024 * 1024
+
+
+def release_many(
+    changelog_paths: Iterable[str],
+    new_version: str = None,
+    *,
+    lock: bool = False,
+    max_workers: Optional[int] = None,
+) -> dict[str, Union[Optional[str], Exception]]:
+    """
+    Release a new version of every changelog, based on their unreleased content.
+
+    Changelogs are released in parallel, each in a separate process.
+
+    :param changelog_paths: Paths to the changelog files.
+    :param new_version: The new version to use (for every changelog) instead of trying to guess one.
+    :param lock: Hold an advisory lock (on a .lock file next to the changelog) during each release,
+    so that concurrent releases of the same changelog are performed one after the other.
+    :param max_workers: Maximum number of processes used to release. Default to the number of processors.
+    :return: python dict containing changelog path as key and the result of the release as value:
+    the new version, None if there was no change to release, or the exception if release failed.
+    """
+    changelog_paths = list(dict.fromkeys(changelog_paths))
+    if not changelog_paths:
+        return {}
+
+    # Do not start more processes than there are changelogs to release
+    max_workers = min(max_workers or os.cpu_count() or 1, len(changelog_paths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        releases = {
+            changelog_path: executor.submit(
+                release, changelog_path, new_version, lock=lock
+            )
+            for changelog_path in changelog_paths
+        }
+        # A failing release does not prevent other changelogs from being released
+        return {
+            changelog_path: future.exception() or future.result()
+            for changelog_path, future in releases.items()
+        }
+
+
+def parallel_to_dict(
+    changelog_path: str,
+    *,
+    show_unreleased: bool = False,
+    max_workers: Optional[int] = None,
+) -> dict[str, dict]:
+    """
+    Convert a (huge) changelog markdown file following keep a changelog format into python dict.
+
+    The changelog is split into chunks of releases, each chunk being parsed in a separate process.
+
+    :param changelog_path: Path to the changelog file.
+    :param show_unreleased: Add unreleased section (if any) to the resulting dictionary.
+    :param max_workers: Maximum number of processes used to parse. Default to the number of processors.
+    :return python dict containing version as key and related changes as value (same as to_dict).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    size = os.path.getsize(changelog_path)
+    chunk_size = max(size // max_workers, min_chunk_size)
+    if size <= chunk_size:
+        return to_dict(changelog_path, show_unreleased=show_unreleased)
+
+    with open(changelog_path, mode="rb") as change_log:
+        with mmap.mmap(change_log.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            chunks = _chunks(content, chunk_size)
+            if len(chunks) == 1:
+                return bytes_to_dict(content, show_unreleased=show_unreleased)
+
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(chunks))
+            ) as executor:
+                starts, ends = zip(*chunks)
+                # Each process reads its own chunk, so that content is not sent to processes
+                parsed_chunks = executor.map(
+                    _parse_chunk, itertools.repeat(changelog_path), starts, ends
+                )
+                changes = {}
+                # As URLs can be defined before actual usage, maintain a separate dict
+                urls = {}
+                for chunk_changes, chunk_urls in parsed_chunks:
+                    # Releases with the same version are merged, only possible by parsing them together
+                    if not changes.keys().isdisjoint(chunk_changes):
+                        executor.shutdown(cancel_futures=True)
+                        return bytes_to_dict(content, show_unreleased=show_unreleased)
+                    changes.update(chunk_changes)
+                    urls.update(chunk_urls)
+
+    return _add_urls(changes, urls, show_unreleased)
+
+
+def _chunks(content: mmap.mmap, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    :return: Start and end offsets of each chunk, chunks (except the first one) starting with a release.
+    """
+    starts = [0]
+    while len(content) - starts[-1] > chunk_size:
+        release_start = release_start_pattern().search(content, starts[-1] + chunk_size)
+        if not release_start:
+            break
+        starts.append(release_start.start() + 1)
+    starts.append(len(content))
+    return list(zip(starts, starts[1:]))
+
+
+def _parse_chunk(
+    changelog_path: str, start: int, end: int
+) -> tuple[dict[str, dict], dict[str, str]]:
+    with open(changelog_path, mode="rb") as change_log:
+        change_log.seek(start)
+        content = str(change_log.read(end - start), "utf-8")
+    # Handle line endings the same way as when reading a file in text mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return _parse_lines(content.split("\n"))
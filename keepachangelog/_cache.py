@@ -0,0 +1,111 @@
+import contextlib
+import marshal
+import os
+import time
+from typing import Callable
+
+from keepachangelog.version import __version__
+
+# Directory where parsed changelogs are stored. Cache is disabled if not set.
+cache_dir_variable = "KEEPACHANGELOG_CACHE_DIR"
+# Entries that were not written for this amount of seconds are removed
+max_entry_age = 30 * 24 * 60 * 60
+
+
+def cached(changelog_path: str, parse: Callable[..., dict], *args) -> dict:
+    """
+    Parse changelog, or load the result of a previous parse of the same changelog content.
+
+    Cache is only used if KEEPACHANGELOG_CACHE_DIR environment variable is set.
+    Entries are identified by changelog path, parsing function and arguments and are
+    considered up to date if changelog modification time and size did not change, or if the content is the same.
+
+    :param changelog_path: Path to the changelog file.
+    :param parse: Function parsing the changelog, called with the changelog path and provided arguments.
+    :return: The result of parse.
+    """
+    cache_dir = os.environ.get(cache_dir_variable)
+    if not cache_dir:
+        return parse(changelog_path, *args)
+
+    stat = os.stat(changelog_path)
+    entry_path = os.path.join(cache_dir, _entry_name(changelog_path, parse, args))
+    entry = _load(entry_path)
+    if entry and entry[1] == stat.st_size:
+        if entry[0] == stat.st_mtime_ns:
+            return entry[3]
+
+        digest = _digest(changelog_path)
+        if entry[2] == digest:
+            # Content did not change, avoid computing digest next time
+            _store(cache_dir, entry_path, (stat.st_mtime_ns, *entry[1:]))
+            return entry[3]
+    else:
+        digest = _digest(changelog_path)
+
+    changes = parse(changelog_path, *args)
+    _evict(cache_dir)
+    _store(cache_dir, entry_path, (stat.st_mtime_ns, stat.st_size, digest, changes))
+    return changes
+
+
+# hashlib and tempfile are only imported if cache is used, to keep import fast
+def _entry_name(changelog_path: str, parse: Callable, args: tuple) -> str:
+    import hashlib
+
+    key = f"{__version__}\n{marshal.version}\n{os.path.abspath(changelog_path)}\n{parse.__qualname__}\n{args!r}"
+    return f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.cache"
+
+
+def _digest(changelog_path: str) -> bytes:
+    import hashlib
+
+    with open(changelog_path, mode="rb") as change_log:
+        return hashlib.sha256(change_log.read()).digest()
+
+
+def _load(entry_path: str) -> tuple:
+    try:
+        with open(entry_path, mode="rb") as entry:
+            return marshal.load(entry)
+    # Consider missing or corrupted entries as not cached
+    except (OSError, EOFError, ValueError, TypeError):
+        return ()
+
+
+def _store(cache_dir: str, entry_path: str, entry: tuple) -> None:
+    import tempfile
+
+    # Cache cannot be written (read-only, full disk...), changelog is still parsed
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write in a temporary file first so that a concurrent read never see a partial entry
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with open(file_descriptor, mode="wb") as temporary_entry:
+            marshal.dump(entry, temporary_entry)
+        os.replace(temporary_path, entry_path)
+    except (OSError, ValueError):
+        with contextlib.suppress(OSError):
+            os.remove(temporary_path)
+
+
+def _evict(cache_dir: str) -> None:
+    try:
+        entries = os.scandir(cache_dir)
+    # Cache directory might not exist yet (or cannot be read)
+    except OSError:
+        return
+
+    oldest_allowed = time.time() - max_entry_age
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".cache"):
+                continue
+            # Entry might be evicted by another process at the same time (or cannot be removed)
+            with contextlib.suppress(OSError):
+                if entry.stat().st_mtime < oldest_allowed:
+                    os.remove(entry.path)
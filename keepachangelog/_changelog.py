@@ -1,19 +1,28 @@
+import contextlib
 import datetime
+import mmap
+import os
 import re
-from typing import Optional, Iterable, Union
+from functools import lru_cache
+from typing import Callable, Optional, Iterable, Iterator, TextIO, Union
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # fcntl is not available on Windows
+    fcntl = None
+    import msvcrt
+
+from keepachangelog._cache import cached
 from keepachangelog._versioning import (
     actual_version,
     guess_unreleased_version,
     to_semantic,
     InvalidSemanticVersion,
+    SemanticVersion,
 )
 
 
-def is_release(line: str) -> bool:
-    return line.startswith("## ")
-
-
 def add_release(changes: dict[str, dict], line: str) -> dict:
     release_line = line[3:].lower().strip(" ")
     # A release is separated by a space between version and release date
@@ -45,21 +54,36 @@ def extract_date(date: str) -> str:
     return date.lstrip(" -(").rstrip(" )")
 
 
-def is_category(line: str) -> bool:
-    return line.startswith("### ")
-
-
 def add_category(release: dict, line: str) -> list[str]:
     category = line[4:].lower().strip(" ")
     return release.setdefault(category, [])
 
 
-# Link pattern should match lines like: "[1.2.3]: https://github.com/user/project/releases/tag/v0.0.1"
-link_pattern = re.compile(r"^\[(.*)\]: (.*)$")
+# Patterns are only compiled once used, to keep import fast
+@lru_cache(maxsize=None)
+def link_pattern() -> re.Pattern:
+    # Link pattern should match lines like: "[1.2.3]: https://github.com/user/project/releases/tag/v0.0.1"
+    return re.compile(r"^\[(.*)\]: (.*)$")
 
 
-def is_link(line: str) -> bool:
-    return link_pattern.fullmatch(line) is not None
+def classify(line: str) -> tuple[str, Optional[re.Match]]:
+    """
+    Identify a changelog line (without surrounding spaces and line ending) based on its first character,
+    so that a single check is performed for most lines.
+
+    :return: A 2-tuple: "release", "category", "link", "information" or "empty", and the link match for links.
+    """
+    first_character = line[:1]
+    if first_character == "#":
+        if line.startswith("## "):
+            return "release", None
+        if line.startswith("### "):
+            return "category", None
+    elif first_character == "[":
+        link_match = link_pattern().fullmatch(line)
+        if link_match:
+            return "link", link_match
+    return ("information" if line else "empty"), None
 
 
 def add_information(category: list[str], line: str) -> None:
@@ -78,13 +102,22 @@ def to_dict(
     """
     # Allow for changelog as a file path or as a context manager providing content
     try:
-        with open(changelog_path, encoding="utf-8") as change_log:
-            return _to_dict(change_log, show_unreleased)
+        return cached(changelog_path, _read_dict, show_unreleased)
     except TypeError:
         return _to_dict(changelog_path, show_unreleased)
 
 
+def _read_dict(changelog_path: str, show_unreleased: bool) -> dict[str, dict]:
+    with open(changelog_path, encoding="utf-8") as change_log:
+        return _to_dict(change_log, show_unreleased)
+
+
 def _to_dict(change_log: Iterable[str], show_unreleased: bool) -> dict[str, dict]:
+    changes, urls = _parse_lines(change_log)
+    return _add_urls(changes, urls, show_unreleased)
+
+
+def _parse_lines(change_log: Iterable[str]) -> tuple[dict[str, dict], dict[str, str]]:
     changes = {}
     # As URLs can be defined before actual usage, maintain a separate dict
     urls = {}
@@ -92,18 +125,24 @@ def _to_dict(change_log: Iterable[str], show_unreleased: bool) -> dict[str, dict
     category = []
     for line in change_log:
         line = line.strip(" \n")
+        kind, link_match = classify(line)
 
-        if is_release(line):
+        if kind == "information":
+            add_information(category, line)
+        elif kind == "release":
             current_release = add_release(changes, line)
             category = current_release.setdefault("uncategorized", [])
-        elif is_category(line):
+        elif kind == "category":
             category = add_category(current_release, line)
-        elif is_link(line):
-            link_match = link_pattern.fullmatch(line)
+        elif kind == "link":
             urls[link_match.group(1).lower()] = link_match.group(2)
-        elif line:
-            add_information(category, line)
 
+    return changes, urls
+
+
+def _add_urls(
+    changes: dict[str, dict], urls: dict[str, str], show_unreleased: bool
+) -> dict[str, dict]:
     # Add url for each version (create version if not existing)
     for version, url in urls.items():
         changes.setdefault(version, {"metadata": {"version": version}})["metadata"][
@@ -127,36 +166,154 @@ def _to_dict(change_log: Iterable[str], show_unreleased: bool) -> dict[str, dict
     return changes
 
 
+def bytes_to_dict(
+    content: Union[bytes, bytearray, memoryview, mmap.mmap],
+    *,
+    show_unreleased: bool = False,
+) -> dict[str, dict]:
+    """
+    Convert UTF-8 encoded changelog markdown content following keep a changelog format into python dict.
+
+    :param content: Content of the changelog file (a memory-mapped file for instance).
+    :param show_unreleased: Add unreleased section (if any) to the resulting dictionary.
+    :return python dict containing version as key and related changes as value.
+    """
+    # Decoding the whole content at once is faster than decoding line by line
+    content = str(content, "utf-8")
+    # Handle line endings the same way as when reading a file in text mode
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return _to_dict(content.split("\n"), show_unreleased)
+
+
+def iter_releases(
+    changelog_path: Union[str, Iterable[str]], *, show_unreleased: bool = False
+) -> Iterator[dict]:
+    """
+    Iterate over releases of a changelog markdown file following keep a changelog format.
+
+    Each release is provided as soon as its section is fully read, allowing to stop without reading the whole file.
+    As URLs are usually defined at the end of the file, the url metadata of an already provided release
+    is only set once the related link is read.
+    Releases that only have a URL (and no section) are provided last.
+
+    :param changelog_path: Path to the changelog file, or context manager providing iteration on lines.
+    :param show_unreleased: Provide unreleased section (if any) as well.
+    :return: Iterator on releases (same structure as the values of the dict returned by to_dict).
+    """
+    # Allow for changelog as a file path or as a context manager providing content
+    try:
+        change_log = open(changelog_path, encoding="utf-8")
+    except TypeError:
+        yield from _iter_releases(changelog_path, show_unreleased)
+        return
+
+    with change_log:
+        yield from _iter_releases(change_log, show_unreleased)
+
+
+def _iter_releases(change_log: Iterable[str], show_unreleased: bool) -> Iterator[dict]:
+    # As URLs can be defined before actual usage, maintain a separate dict
+    urls = {}
+    # Keep track of provided metadata only, to be able to set the URL once known
+    provided = {}
+    current_release = None
+    category = []
+    for line in change_log:
+        line = line.strip(" \n")
+        kind, link_match = classify(line)
+
+        if kind == "information":
+            add_information(category, line)
+        elif kind == "release":
+            if current_release:
+                yield from _provide_release(
+                    current_release, urls, provided, show_unreleased
+                )
+            current_release = add_release({}, line)
+            category = current_release.setdefault("uncategorized", [])
+        elif kind == "category":
+            # Categories are not expected before the first release
+            category = add_category(current_release or {}, line)
+        elif kind == "link":
+            version = link_match.group(1).lower()
+            urls[version] = link_match.group(2)
+            if version in provided:
+                provided[version]["url"] = urls[version]
+
+    if current_release:
+        yield from _provide_release(current_release, urls, provided, show_unreleased)
+
+    # Provide versions that only have a URL
+    for version, url in urls.items():
+        if version not in provided:
+            yield {"metadata": {"version": version, "url": url}}
+
+
+def _provide_release(
+    current_release: dict, urls: dict, provided: dict, show_unreleased: bool
+) -> Iterator[dict]:
+    metadata = current_release["metadata"]
+    provided[metadata["version"]] = metadata
+    if metadata["version"] in urls:
+        metadata["url"] = urls[metadata["version"]]
+
+    # Avoid empty uncategorized
+    if not current_release["uncategorized"]:
+        del current_release["uncategorized"]
+
+    # If there is an empty release date, it identify the unreleased section
+    if show_unreleased or metadata["release_date"]:
+        yield current_release
+
+
 def from_dict(changes: dict[str, dict]) -> str:
-    content = """# Changelog
+    return "".join(_iter_markdown(changes))
+
+
+def write_dict(changes: dict[str, dict], file: TextIO) -> None:
+    """
+    Write changelog markdown following keep a changelog format, without building the whole content in memory.
+
+    :param changes: python dict containing version as key and related changes as value (as returned by to_dict).
+    :param file: Writable text file (such as a file opened with mode="wt").
+    """
+    file.writelines(_iter_markdown(changes))
+
+
+def _iter_markdown(changes: dict[str, dict]) -> Iterator[str]:
+    yield """# Changelog
 All notable changes to this project will be documented in this file.
 
 The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.1.0/),
 and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).\n"""
 
+    # Content is provided release per release
     for current_release in changes.values():
         metadata = current_release["metadata"]
-        content += f"\n## [{metadata['version'].capitalize()}]"
+        content = [f"\n## [{metadata['version'].capitalize()}]"]
 
         if metadata.get("release_date"):
-            content += f" - {metadata['release_date']}"
+            content.append(f" - {metadata['release_date']}")
 
         uncategorized = current_release.get("uncategorized", [])
         for category_content in uncategorized:
-            content += f"\n* {category_content}"
+            content.append(f"\n* {category_content}")
         if uncategorized:
-            content += "\n"
+            content.append("\n")
 
         for category_name, category_content in current_release.items():
             if category_name in ["metadata", "uncategorized"]:
                 continue
 
-            content += f"\n### {category_name.capitalize()}"
+            content.append(f"\n### {category_name.capitalize()}")
 
             for categorized in category_content:
-                content += f"\n- {categorized}"
+                content.append(f"\n- {categorized}")
+
+            content.append("\n")
 
-            content += "\n"
+        yield "".join(content)
 
     urls_content = []
     for current_release in changes.values():
@@ -166,30 +323,54 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
         urls_content.append(f"[{metadata['version'].capitalize()}]: {metadata['url']}")
 
     if urls_content:
-        content += "\n"
-        content += "\n".join(urls_content)
-        content += "\n"
+        yield "\n"
+        yield "\n".join(urls_content)
+        yield "\n"
 
-    return content
+
+def to_raw_dict(changelog_path: str, *, lazy: bool = False) -> dict[str, dict]:
+    """
+    Convert changelog markdown file following keep a changelog format into python dict, keeping release content as is.
+
+    :param changelog_path: Path to the changelog file.
+    :param lazy: Memory-map the changelog file and provide raw content as LazyRaw (converted to str on demand)
+    instead of copying the content of every release. The resulting LazyRawChanges should then be closed
+    (or used as a context manager), and the file must not be modified in place until then.
+    :return python dict containing version as key and related raw changes as value.
+    """
+    if lazy:
+        return _read_lazy_raw(changelog_path)
+    return cached(changelog_path, _read_raw)
 
 
-def to_raw_dict(changelog_path: str) -> dict[str, dict]:
+def _read_raw(changelog_path: str) -> dict[str, dict]:
     changes = {}
     # As URLs can be defined before actual usage, maintain a separate dict
     urls = {}
+    # Raw lines are only joined once the whole file is read
+    raw_lines = {}
     with open(changelog_path, encoding="utf-8") as change_log:
-        current_release = {}
+        raw = []
         for line in change_log:
             clean_line = line.strip(" \n")
+            kind, link_match = classify(clean_line)
 
-            if is_release(clean_line):
+            if kind == "information" or kind == "category":
+                raw.append(line)
+            elif kind == "release":
                 current_release = add_release(changes, clean_line)
-            elif is_link(clean_line):
-                link_match = link_pattern.fullmatch(clean_line)
+                raw = raw_lines.setdefault(current_release["metadata"]["version"], [])
+            elif kind == "link":
                 urls[link_match.group(1).lower()] = link_match.group(2)
-            elif clean_line:
-                current_release["raw"] = current_release.get("raw", "") + line
 
+    for version, raw in raw_lines.items():
+        if raw:
+            changes[version]["raw"] = "".join(raw)
+
+    return _add_raw_urls(changes, urls)
+
+
+def _add_raw_urls(changes: dict[str, dict], urls: dict) -> dict[str, dict]:
     # Add url for each version (create version if not existing)
     for version, url in urls.items():
         changes.setdefault(version, {"metadata": {"version": version}})["metadata"][
@@ -208,60 +389,365 @@ def to_raw_dict(changelog_path: str) -> dict[str, dict]:
     return changes
 
 
-def release(changelog_path: str, new_version: str = None) -> Optional[str]:
+class LazyRaw:
+    """
+    Raw content of a release within a memory-mapped changelog file, only decoded when converted to str.
+    """
+
+    __slots__ = ("_buffer", "_spans")
+
+    def __init__(self, buffer: mmap.mmap, spans: list[list[int]]):
+        self._buffer = buffer
+        # Start and end offsets of the (non-empty) lines of the release
+        self._spans = spans
+
+    def __str__(self) -> str:
+        raw = b"".join(self._buffer[start:end] for start, end in self._spans)
+        return raw.decode("utf-8").replace("\r\n", "\n")
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (str, LazyRaw)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+class LazyRawChanges(dict):
+    """
+    python dict returned by to_raw_dict when lazy, holding the memory-mapped changelog file.
+
+    The file must not be modified in place (truncated or rewritten) while the mapping is open,
+    as reading a LazyRaw would then crash the interpreter. Close it (or use it as a context manager)
+    once raw contents are not needed anymore, LazyRaw cannot be converted to str once closed.
+    """
+
+    def __init__(self, buffer: Optional[mmap.mmap] = None):
+        super().__init__()
+        self._buffer = buffer
+
+    def close(self) -> None:
+        if self._buffer is not None:
+            self._buffer.close()
+
+    def __enter__(self) -> "LazyRawChanges":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _read_lazy_raw(changelog_path: str) -> LazyRawChanges:
+    # As URLs can be defined before actual usage, maintain a separate dict
+    urls = {}
+    with open(changelog_path, mode="rb") as change_log:
+        # Empty files cannot be memory-mapped
+        if not os.fstat(change_log.fileno()).st_size:
+            return LazyRawChanges()
+        buffer = mmap.mmap(change_log.fileno(), 0, access=mmap.ACCESS_READ)
+
+    changes = LazyRawChanges(buffer)
+
+    raw_spans = {}
+    spans = []
+    start = 0
+    for line in iter(buffer.readline, b""):
+        end = start + len(line)
+        clean_line = line.strip(b" \r\n")
+
+        if clean_line.startswith(b"## "):
+            current_release = add_release(changes, clean_line.decode("utf-8"))
+            spans = raw_spans.setdefault(current_release["metadata"]["version"], [])
+        elif clean_line.startswith(b"[") and (
+            link_match := link_pattern().fullmatch(clean_line.decode("utf-8"))
+        ):
+            urls[link_match.group(1).lower()] = link_match.group(2)
+        elif clean_line:
+            # Merge consecutive lines into a single span
+            if spans and spans[-1][1] == start:
+                spans[-1][1] = end
+            else:
+                spans.append([start, end])
+        start = end
+
+    for version, spans in raw_spans.items():
+        if spans:
+            changes[version]["raw"] = LazyRaw(buffer, spans)
+
+    return _add_raw_urls(changes, urls)
+
+
+def find_raw_release(changelog_path: str, version: str) -> Optional[dict]:
+    """
+    Retrieve the raw content of a release, reading the changelog only up to the end of this release section.
+
+    Note: As links are usually defined at the end of the file, url metadata is not provided.
+    Following sections of the same version are merged (as within to_raw_dict),
+    but sections of this version found further in the changelog (after another release) are not.
+
+    :param changelog_path: Path to the changelog file.
+    :param version: The version to search in the changelog.
+    :return: The release (same structure as the values of the dict returned by to_raw_dict), None if not found.
+    """
+    version = version.lower()
+    with open(changelog_path, encoding="utf-8") as change_log:
+        for current_release in _iter_raw_releases(change_log):
+            metadata = current_release["metadata"]
+            # If there is an empty release date, it identify the unreleased section
+            if metadata["version"] == version and metadata["release_date"]:
+                return current_release
+
+
+def iter_raw_releases(
+    changelog_path: str, *, since: Optional[str] = None
+) -> Iterator[dict]:
+    """
+    Iterate over the raw content of releases, from the newest to the oldest, as soon as their section is read.
+
+    Note: As links are usually defined at the end of the file, url metadata is not provided.
+    Unreleased section is not provided.
+
+    :param changelog_path: Path to the changelog file.
+    :param since: Only provide releases more recent than this version.
+    As releases are expected to be ordered from the newest to the oldest, the changelog is only read
+    up to the title of this release (or of the first older release if this version is not within the changelog).
+    :return: Iterator on releases (same structure as the values of the dict returned by to_raw_dict).
+    """
+    until = _older_than(since) if since else None
+    with open(changelog_path, encoding="utf-8") as change_log:
+        for current_release in _iter_raw_releases(change_log, until):
+            # If there is an empty release date, it identify the unreleased section
+            if current_release["metadata"]["release_date"]:
+                yield current_release
+
+
+def _older_than(version: str) -> Callable[[dict], bool]:
+    """
+    :return: A function checking if release metadata is the one of this version or of an older version.
+    """
+    version = version.lower()
+    try:
+        semantic_version = SemanticVersion.parse(version)
+    except InvalidSemanticVersion:
+        semantic_version = None
+
+    def older_than(metadata: dict) -> bool:
+        if metadata["version"] == version:
+            return True
+        # Versions not following semantic versioning cannot be compared
+        return bool(
+            semantic_version is not None
+            and "semantic_version" in metadata
+            and SemanticVersion.from_dict(metadata["semantic_version"])
+            < semantic_version
+        )
+
+    return older_than
+
+
+def _iter_raw_releases(
+    change_log: Iterable[str], until: Optional[Callable[[dict], bool]] = None
+) -> Iterator[dict]:
+    """
+    :param until: Stop reading once a release title matches (without providing this release).
+    """
+    current_release = None
+    raw = []
+    for line in change_log:
+        clean_line = line.strip(" \n")
+        kind, _ = classify(clean_line)
+
+        if kind == "information" or kind == "category":
+            raw.append(line)
+        elif kind == "release":
+            new_release = add_release({}, clean_line)
+            # Following sections of the same version are merged (as within to_raw_dict)
+            if (
+                current_release
+                and current_release["metadata"]["version"]
+                == new_release["metadata"]["version"]
+            ):
+                continue
+            if current_release:
+                yield _add_raw(current_release, raw)
+            current_release = new_release
+            if until and until(current_release["metadata"]):
+                return
+            raw = []
+
+    if current_release:
+        yield _add_raw(current_release, raw)
+
+
+def _add_raw(current_release: dict, raw: list[str]) -> dict:
+    if raw:
+        current_release["raw"] = "".join(raw)
+    return current_release
+
+
+def release(
+    changelog_path: str, new_version: str = None, *, lock: bool = False
+) -> Optional[str]:
     """
     Release a new version based on changelog unreleased content.
 
     :param changelog_path: Path to the changelog file.
     :param new_version: The new version to use instead of trying to guess one.
+    :param lock: Hold an advisory lock (on a .lock file next to the changelog) during release,
+    so that concurrent releases of the same changelog are performed one after the other.
     :return: The new version, None if there was no change to release.
     """
-    changelog = to_dict(changelog_path, show_unreleased=True)
-    current_version, current_semantic_version = actual_version(changelog)
-    if not new_version:
-        new_version = guess_unreleased_version(changelog, current_semantic_version)
-    if new_version:
-        release_version(changelog_path, current_version, new_version)
-    return new_version
+    with _locked(changelog_path) if lock else contextlib.nullcontext():
+        # Changelog is read once, to guess the new version and to update the content
+        content = _read_content(changelog_path)
+        changelog = bytes_to_dict(content, show_unreleased=True)
+        current_version, current_semantic_version = actual_version(changelog)
+        if not new_version:
+            new_version = guess_unreleased_version(changelog, current_semantic_version)
+        if new_version:
+            _write_patched(
+                changelog_path,
+                content,
+                _release_patches(content, current_version, new_version),
+            )
+        return new_version
 
 
 def release_version(
     changelog_path: str, current_version: Optional[str], new_version: str
 ) -> None:
-    unreleased_link_pattern = re.compile(r"^\[Unreleased\]: (.*)$", re.DOTALL)
-    lines = []
-    with open(changelog_path, encoding="utf-8") as change_log:
-        for line in change_log.readlines():
-            # Move Unreleased section to new version
-            if re.fullmatch(r"^## \[Unreleased\].*$", line, re.DOTALL):
-                lines.append(line)
-                lines.append("\n")
-                lines.append(
-                    f"## [{new_version}] - {datetime.date.today().isoformat()}\n"
-                )
-            # Add new version link and update Unreleased link
-            elif unreleased_link_pattern.fullmatch(line):
-                unreleased_compare_pattern = re.fullmatch(
-                    r"^.*/(.*)\.\.\.(\w*).*$", line, re.DOTALL
-                )
-                # Unreleased link compare previous version to HEAD (unreleased tag)
-                if unreleased_compare_pattern:
-                    new_unreleased_link = line.replace(current_version, new_version)
-                    lines.append(new_unreleased_link)
-                    current_tag = unreleased_compare_pattern.group(1)
-                    unreleased_tag = unreleased_compare_pattern.group(2)
-                    new_tag = current_tag.replace(current_version, new_version)
-                    lines.append(
-                        line.replace(new_version, current_version)
-                        .replace(unreleased_tag, new_tag)
-                        .replace("Unreleased", new_version)
-                    )
-                # Consider that there is no way to know how to create a link to compare versions
-                else:
-                    lines.append(line)
-                    lines.append(line.replace("Unreleased", new_version))
-            else:
-                lines.append(line)
+    content = _read_content(changelog_path)
+    _write_patched(
+        changelog_path,
+        content,
+        _release_patches(content, current_version, new_version),
+    )
+
+
+@contextlib.contextmanager
+def _locked(changelog_path: str) -> Iterator[None]:
+    with open(f"{changelog_path}.lock", mode="ab") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        # Lock is released when file is closed
+        yield
+
+
+def _read_content(changelog_path: str) -> bytes:
+    with open(changelog_path, mode="rb") as change_log:
+        return change_log.read()
+
+
+def _write_patched(
+    changelog_path: str, content: bytes, patches: Iterable[tuple[int, int, bytes]]
+) -> None:
+    """
+    Write content with some byte ranges replaced.
 
-    with open(changelog_path, mode="wt", encoding="utf-8") as change_log:
-        change_log.writelines(lines)
+    :param patches: Ordered (start, end, replacement) non overlapping byte ranges to replace.
+    """
+    # Only needed to write, avoid importing them for every command
+    import shutil
+    import tempfile
+
+    # Replace the target of the link (if any) and not the link itself
+    changelog_path = os.path.realpath(changelog_path)
+    # Write to a temporary file first so that the changelog is never partially written
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=os.path.dirname(changelog_path),
+        prefix=f".{os.path.basename(changelog_path)}.",
+    )
+    try:
+        with open(file_descriptor, mode="wb") as change_log:
+            # Content between patches is written as is, without copying it
+            unchanged = memoryview(content)
+            position = 0
+            for start, end, replacement in patches:
+                change_log.write(unchanged[position:start])
+                change_log.write(replacement)
+                position = end
+            change_log.write(unchanged[position:])
+            change_log.flush()
+            os.fsync(change_log.fileno())
+        shutil.copymode(changelog_path, temporary_path)
+        os.replace(temporary_path, changelog_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+unreleased_release_prefix = b"## [Unreleased]"
+unreleased_link_prefix = b"[Unreleased]: "
+
+
+@lru_cache(maxsize=None)
+def unreleased_compare_pattern() -> re.Pattern:
+    # Unreleased link compare previous version to HEAD (unreleased tag)
+    return re.compile(r"^.*/(.*)\.\.\.(\w*).*$", re.DOTALL)
+
+
+def _release_patches(
+    content: bytes, current_version: Optional[str], new_version: str
+) -> list[tuple[int, int, bytes]]:
+    """
+    Compute the changes to perform on the changelog to release a new version.
+
+    Only Unreleased section title and Unreleased link lines are modified.
+
+    :return: Ordered (start, end, replacement) byte ranges.
+    """
+    patches = []
+    # Move Unreleased section to new version
+    for start, end in _lines_starting_with(content, unreleased_release_prefix):
+        newline = _newline(content, end)
+        release_date = datetime.date.today().isoformat()
+        new_title = f"{newline}{newline}## [{new_version}] - {release_date}"
+        patches.append((end, end, new_title.encode("utf-8")))
+    # Add new version link and update Unreleased link
+    for start, end in _lines_starting_with(content, unreleased_link_prefix):
+        newline = _newline(content, end)
+        line = content[start:end].decode("utf-8")
+        unreleased_compare = unreleased_compare_pattern().fullmatch(line)
+        if unreleased_compare:
+            current_tag = unreleased_compare.group(1)
+            unreleased_tag = unreleased_compare.group(2)
+            new_tag = current_tag.replace(current_version, new_version)
+            new_lines = (
+                line.replace(current_version, new_version),
+                line.replace(new_version, current_version)
+                .replace(unreleased_tag, new_tag)
+                .replace("Unreleased", new_version),
+            )
+        # Consider that there is no way to know how to create a link to compare versions
+        else:
+            new_lines = (line, line.replace("Unreleased", new_version))
+        patches.append((start, end, newline.join(new_lines).encode("utf-8")))
+    return sorted(patches)
+
+
+def _lines_starting_with(content: bytes, prefix: bytes) -> Iterator[tuple[int, int]]:
+    """
+    :return: Start and end (excluding line ending) byte offsets of every line starting with prefix.
+    """
+    # Searching for the prefix is way faster than checking every line
+    start = content.find(prefix)
+    while start != -1:
+        if start == 0 or content[start - 1 : start] == b"\n":
+            end = content.find(b"\n", start)
+            if end == -1:
+                end = len(content)
+            if content[end - 1 : end] == b"\r":
+                end -= 1
+            yield start, end
+        start = content.find(prefix, start + 1)
+
+
+def _newline(content: bytes, line_end: int) -> str:
+    # Added lines are using the same line ending as the line they follow
+    return "\r\n" if content.startswith(b"\r\n", line_end) else "\n"
@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Same as typing.TYPE_CHECKING (understood by type checkers), without importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Optional
+
+# Path to the Unix socket of a running "keepachangelog serve". Commands are run locally if not set.
+socket_variable = "KEEPACHANGELOG_SOCKET"
+# Number of seconds to wait for the server (to connect and then for each read), so that a stopped server cannot block
+timeout = 60
+
+
+def forward(command_line: list[str]) -> "Optional[int]":
+    """
+    Run command line on the running server (if any), displaying its output.
+
+    :return: The exit code of the command, None if there is no running server.
+    """
+    socket_path = os.environ.get(socket_variable)
+    if not socket_path:
+        return None
+
+    # Only imported if a server is expected, to keep command line fast
+    import json
+    import socket
+
+    # Unix sockets are not available on every platform
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        return None
+
+    with socket.socket(socket.AF_UNIX) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(socket_path)
+        # Server is not running, command will be run locally
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+
+        request = {"argv": command_line, "cwd": os.getcwd()}
+        try:
+            client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with client.makefile(mode="rb") as server:
+                response = json.loads(server.readline())
+        # Command is not run locally, as it might still be run by the server
+        except socket.timeout:
+            sys.stderr.write(
+                f"Server listening on {socket_path} did not answer within {timeout} seconds."
+            )
+            return 2
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["exit_code"]
@@ -0,0 +1,138 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+from keepachangelog._changelog import bytes_to_dict, _parse_lines
+
+
+class IncrementalParser:
+    """
+    Convert successive contents of a changelog into python dicts, only parsing again the releases that changed.
+
+    Content is split into sections (content before the first release, each release, and links ending the changelog).
+    Sections that did not change since the previous conversion are not parsed again,
+    and the related releases are shared with the previously provided dict.
+    """
+
+    def __init__(self, *, show_unreleased: bool = False):
+        """
+        :param show_unreleased: Add unreleased section (if any) to the resulting dictionaries.
+        """
+        self.show_unreleased = show_unreleased
+        # Release (if any) and links of each section of the previous content
+        self._sections: dict[bytes, tuple[Optional[dict], dict[str, str]]] = {}
+        # Previously provided releases having an url, per section and url
+        self._releases_with_url: dict[tuple[bytes, str], dict] = {}
+
+    def to_dict(self, content: bytes) -> dict[str, dict]:
+        """
+        Convert UTF-8 encoded changelog markdown content following keep a changelog format into python dict.
+
+        :param content: Content of the changelog file.
+        :return python dict containing version as key and related changes as value.
+        As unchanged releases are shared across calls, it should not be modified.
+        """
+        # Lone carriage returns are line endings that are not used to split sections
+        if b"\r" in content and content.count(b"\r") != content.count(b"\r\n"):
+            return self._parse(content)
+
+        sections = {}
+        changes = {}
+        urls = {}
+        release_sections = {}
+        for section in _split_sections(content):
+            parsed = self._sections.get(section) or _parse_section(section)
+            sections[section] = parsed
+            current_release, section_urls = parsed
+            if current_release:
+                version = current_release["metadata"]["version"]
+                # Releases with the same version are merged, only possible by parsing them together
+                if version in changes:
+                    return self._parse(content)
+                changes[version] = current_release
+                release_sections[version] = section
+            urls.update(section_urls)
+
+        # Add url for each version (create version if not existing)
+        releases_with_url = {}
+        for version, url in urls.items():
+            if version not in changes:
+                changes[version] = {"metadata": {"version": version, "url": url}}
+                continue
+
+            key = release_sections[version], url
+            current_release = self._releases_with_url.get(key)
+            # Parsed releases are left untouched as they might be provided again
+            if not current_release:
+                current_release = changes[version]
+                current_release = {
+                    **current_release,
+                    "metadata": {**current_release["metadata"], "url": url},
+                }
+            changes[version] = releases_with_url[key] = current_release
+
+        if not self.show_unreleased:
+            unreleased_version = None
+            for version, current_release in changes.items():
+                metadata = current_release["metadata"]
+                # If there is an empty release date, it identify the unreleased section
+                if ("release_date" in metadata) and not metadata["release_date"]:
+                    unreleased_version = version
+            changes.pop(unreleased_version, None)
+
+        self._sections = sections
+        self._releases_with_url = releases_with_url
+        return changes
+
+    def _parse(self, content: bytes) -> dict[str, dict]:
+        self._sections = {}
+        self._releases_with_url = {}
+        return bytes_to_dict(content, show_unreleased=self.show_unreleased)
+
+
+def _split_sections(content: bytes) -> list[bytes]:
+    # Content before the first release (might be empty if content starts with a release)
+    starts = [0]
+    starts.extend(
+        match.start() + 1 for match in release_start_pattern().finditer(content)
+    )
+
+    # Links (usually defined at the end) are not part of the last release
+    starts.append(_links_start(content, starts[-1]))
+    starts.append(len(content))
+    return [
+        content[start:end] for start, end in zip(starts, starts[1:]) if start != end
+    ]
+
+
+@lru_cache(maxsize=None)
+def release_start_pattern() -> re.Pattern:
+    # Releases are starting with "## " (once spaces are stripped), "### " being categories
+    # A line only containing "## " (and spaces) is not a release, as stripped to "##"
+    return re.compile(rb"\n *## +[^ \r\n]")
+
+
+def _links_start(content: bytes, start: int) -> int:
+    """
+    :return: Offset of the links (and empty lines) ending the content, not before start.
+    """
+    links_start = len(content)
+    while links_start > start:
+        line_start = max(content.rfind(b"\n", start, links_start - 1) + 1, start)
+        line = content[line_start:links_start].strip(b" \r\n")
+        # Same as matching link_pattern as line starts with "["
+        if line and not (line.startswith(b"[") and b"]: " in line):
+            break
+        links_start = line_start
+    return links_start
+
+
+def _parse_section(section: bytes) -> tuple[Optional[dict], dict[str, str]]:
+    lines = str(section, "utf-8").replace("\r\n", "\n").split("\n")
+    changes, urls = _parse_lines(lines)
+    # A section contains at most one release (none before the first release or for links)
+    current_release = next(iter(changes.values()), None)
+    # Avoid empty uncategorized
+    if current_release and not current_release.get("uncategorized"):
+        current_release.pop("uncategorized", None)
+    return current_release, urls
@@ -0,0 +1,161 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from keepachangelog._changelog import _iter_raw_releases
+from keepachangelog._incremental import IncrementalParser
+
+
+class Changelog:
+    """
+    Changelog file that is only parsed again if it changed since the previous parsing.
+    """
+
+    def __init__(
+        self, changelog_path: str, *, show_unreleased: bool = False, ttl: float = 0
+    ):
+        """
+        :param changelog_path: Path to the changelog file.
+        :param show_unreleased: Add unreleased section (if any) to the resulting dictionary.
+        :param ttl: Number of seconds during which the file is not checked for changes once checked.
+        Default to 0 (file is checked every time).
+        """
+        self.changelog_path = changelog_path
+        self.show_unreleased = show_unreleased
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        # Modification time, size and inode of the file when it was parsed
+        self._signature: Optional[tuple[int, int, int]] = None
+        self._etag: Optional[str] = None
+        self._content: bytes = b""
+        # Parsing and JSON are only performed once requested
+        self._changes: Optional[dict[str, dict]] = None
+        self._json: Optional[bytes] = None
+        self._raw_releases: Optional[dict[str, dict]] = None
+        # Only releases that changed are parsed again
+        self._parser = IncrementalParser(show_unreleased=show_unreleased)
+
+    def to_dict(self) -> dict[str, dict]:
+        """
+        Convert changelog markdown file following keep a changelog format into python dict.
+
+        :return python dict containing version as key and related changes as value.
+        As it is shared across calls, it should not be modified.
+        """
+        with self._lock:
+            self._refresh()
+            return self._to_dict()
+
+    def find_raw_release(self, version: str) -> Optional[dict]:
+        """
+        Retrieve the raw content of a release.
+
+        Note: url metadata is not provided.
+        Following sections of the same version are merged (as within to_raw_dict),
+        but sections of this version found further in the changelog (after another release) are not.
+
+        :param version: The version to search in the changelog.
+        :return: The release (same structure as the values of the dict returned by to_raw_dict), None if not found.
+        As it is shared across calls, it should not be modified.
+        """
+        with self._lock:
+            self._refresh()
+            if self._raw_releases is None:
+                self._raw_releases = {}
+                for release in _iter_raw_releases(self._lines()):
+                    metadata = release["metadata"]
+                    # If there is an empty release date, it identify the unreleased section
+                    if metadata["release_date"]:
+                        self._raw_releases.setdefault(metadata["version"], release)
+            return self._raw_releases.get(version.lower())
+
+    def to_json(self) -> tuple[bytes, str]:
+        """
+        Convert changelog markdown file following keep a changelog format into JSON.
+
+        :return: A 2-tuple: UTF-8 encoded JSON of the python dict returned by to_dict,
+        and a strong entity tag (ETag) computed from the changelog file content.
+        """
+        with self._lock:
+            self._refresh()
+            if self._json is None:
+                self._json = json.dumps(
+                    self._to_dict(), ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+            return self._json, self._etag
+
+    def cached_json(self) -> Optional[tuple[bytes, str]]:
+        """
+        Same as to_json, but without waiting, reading nor parsing (only checking the file for changes).
+
+        :return: None if the changelog is being checked by another thread, changed or was not converted yet.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if self._json is None or self._changed_signature() is not None:
+                return None
+            return self._json, self._etag
+        finally:
+            self._lock.release()
+
+    def _changed_signature(self) -> Optional[tuple[int, int, int]]:
+        """
+        :return: Modification time, size and inode of the file if it changed since parsed, None otherwise.
+        """
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.ttl:
+            return None
+
+        stat = os.stat(self.changelog_path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if signature == self._signature:
+            self._checked_at = now
+            return None
+        return signature
+
+    def _refresh(self) -> None:
+        signature = self._changed_signature()
+        if signature is None:
+            return
+
+        with open(self.changelog_path, mode="rb") as change_log:
+            content = change_log.read()
+        etag = f'"{hashlib.sha256(content).hexdigest()}"'
+        # File might have been modified without any change in content
+        if etag != self._etag:
+            self._content = content
+            self._etag = etag
+            self._changes = None
+            self._json = None
+            self._raw_releases = None
+        self._signature = signature
+        self._checked_at = time.monotonic()
+
+    def _to_dict(self) -> dict[str, dict]:
+        if self._changes is None:
+            self._changes = self._parser.to_dict(self._content)
+        return self._changes
+
+    def _lines(self) -> io.TextIOWrapper:
+        return io.TextIOWrapper(io.BytesIO(self._content), encoding="utf-8")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check if the entity tag matches the If-None-Match HTTP request header value (using weak comparison).
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag in [
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    ]
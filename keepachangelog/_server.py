@@ -0,0 +1,108 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+from typing import Optional
+
+from keepachangelog._memoized import Changelog
+
+
+class Server(socketserver.UnixStreamServer):
+    """
+    Answer keepachangelog command lines sent over a Unix socket, keeping parsed changelogs in memory.
+
+    A request is a JSON line containing the command line arguments ("argv")
+    and the working directory of the client ("cwd").
+    The response is a JSON line containing "stdout", "stderr" and "exit_code" of the command.
+    Requests are handled one after the other.
+    """
+
+    def __init__(self, socket_path: str):
+        """
+        :param socket_path: Path to the Unix socket to listen on. Socket is only accessible by the current user.
+        """
+        _remove_stale_socket(socket_path)
+        self.changelogs: dict[str, Changelog] = {}
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_bind(self) -> None:
+        # Socket is created only accessible by the current user (instead of changing permissions once reachable)
+        previous_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.server_address)
+
+    def to_dict(self, changelog_path: str) -> dict[str, dict]:
+        return self._changelog(changelog_path).to_dict()
+
+    def find_raw_release(self, changelog_path: str, version: str) -> Optional[dict]:
+        return self._changelog(changelog_path).find_raw_release(version)
+
+    def _changelog(self, changelog_path: str) -> Changelog:
+        changelog_path = os.path.abspath(changelog_path)
+        if changelog_path not in self.changelogs:
+            self.changelogs[changelog_path] = Changelog(changelog_path)
+        return self.changelogs[changelog_path]
+
+    def run(self, command_line: list[str], cwd: str) -> dict:
+        # Avoid circular import as the command line relies on this module
+        from keepachangelog.__main__ import main
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd = os.getcwd()
+        try:
+            # Relative paths are relative to the client working directory
+            os.chdir(cwd)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                main(command_line, server=self)
+            exit_code = 0
+        except SystemExit as exit:
+            exit_code = exit.code or 0
+        except Exception as error:
+            stderr.write(f"{type(error).__name__}: {error}")
+            exit_code = 1
+        finally:
+            os.chdir(previous_cwd)
+
+        return {
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: Server
+
+    def handle(self) -> None:
+        request = self.rfile.readline()
+        # Connection might be closed without request (to check if server is running)
+        if not request:
+            return
+
+        request = json.loads(request)
+        response = self.server.run(request["argv"], request["cwd"])
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not os.path.exists(socket_path):
+        return
+
+    with socket.socket(socket.AF_UNIX) as client:
+        try:
+            client.connect(socket_path)
+        # Socket file was left behind by a server that is not running anymore
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+
+    raise OSError(f"{socket_path} is already used by a running server.")
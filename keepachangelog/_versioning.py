@@ -1,21 +1,17 @@
 import re
-from functools import cmp_to_key
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from typing import Optional, Iterable
 
-initial_semantic_version = {
-    "major": 0,
-    "minor": 0,
-    "patch": 0,
-    "prerelease": None,
-    "buildmetadata": None,
-}
-
 
 class InvalidSemanticVersion(Exception):
     def __init__(self, version: str):
-        super().__init__(
-            f"{version} is not following semantic versioning. Check https://semver.org for more information."
-        )
+        # Only the version is provided as argument, so that the exception can be pickled (sent across processes)
+        super().__init__(version)
+        self.version = version
+
+    def __str__(self) -> str:
+        return f"{self.version} is not following semantic versioning. Check https://semver.org for more information."
 
 
 def contains_breaking_changes(unreleased: dict) -> bool:
@@ -26,94 +22,176 @@ def only_contains_bug_fixes(unreleased: dict) -> bool:
     return {"fixed"} == set(unreleased) - {"uncategorized"}
 
 
-def bump_major(semantic_version: dict) -> None:
-    semantic_version["major"] += 1
-    semantic_version["minor"] = 0
-    semantic_version["patch"] = 0
-    semantic_version["prerelease"] = None
-    semantic_version["buildmetadata"] = None
-
-
-def bump_minor(semantic_version: dict) -> None:
-    semantic_version["minor"] += 1
-    semantic_version["patch"] = 0
-    semantic_version["prerelease"] = None
-    semantic_version["buildmetadata"] = None
-
-
-def bump_patch(semantic_version: dict) -> None:
-    semantic_version["patch"] += 1
-    semantic_version["prerelease"] = None
-    semantic_version["buildmetadata"] = None
-
-
-def bump(unreleased: dict, semantic_version: dict) -> dict:
-    if semantic_version["prerelease"]:
-        semantic_version["prerelease"] = None
-        semantic_version["buildmetadata"] = None
-    elif contains_breaking_changes(unreleased):
-        bump_major(semantic_version)
-    elif only_contains_bug_fixes(unreleased):
-        bump_patch(semantic_version)
-    else:
-        bump_minor(semantic_version)
-    return semantic_version
-
-
-def _compare(first_version: str, second_version: str) -> int:
-    if first_version > second_version:
-        return 1
-
-    if first_version < second_version:
-        return -1
-
-    return 0
-
+class SemanticVersion:
+    """
+    Immutable semantic version.
 
-def semantic_order(
-    first_version: tuple[str, dict], second_version: tuple[str, dict]
-) -> int:
-    _, semantic_first_version = first_version
-    _, semantic_second_version = second_version
+    Versions are ordered following https://semver.org/#spec-item-11 (build metadata is not considered).
+    """
 
-    major_difference = _compare(
-        semantic_first_version["major"], semantic_second_version["major"]
-    )
-    if major_difference:
-        return major_difference
+    __slots__ = ("major", "minor", "patch", "prerelease", "buildmetadata", "_key")
+
+    def __init__(
+        self,
+        major: int = 0,
+        minor: int = 0,
+        patch: int = 0,
+        prerelease: Optional[str] = None,
+        buildmetadata: Optional[str] = None,
+    ):
+        # Attributes cannot be set once initialized
+        set_attribute = object.__setattr__
+        set_attribute(self, "major", major)
+        set_attribute(self, "minor", minor)
+        set_attribute(self, "patch", patch)
+        set_attribute(self, "prerelease", prerelease)
+        set_attribute(self, "buildmetadata", buildmetadata)
+        # Precedence is computed once to speed up comparisons
+        set_attribute(self, "_key", (major, minor, patch, prerelease_key(prerelease)))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse(version: Optional[str]) -> "SemanticVersion":
+        """
+        As the same versions are usually parsed many times, results are cached (least recently used versions are discarded).
+        Cache statistics can be retrieved via SemanticVersion.parse.cache_info()
+
+        :param version: The version as a string, 0.0.0 if not provided.
+        :raises InvalidSemanticVersion: if version is not following semantic versioning.
+        """
+        if not version:
+            return SemanticVersion()
+
+        match = semantic_versioning().fullmatch(version)
+        if not match:
+            raise InvalidSemanticVersion(version)
+
+        return SemanticVersion(
+            int(match["major"]),
+            int(match["minor"]),
+            int(match["patch"]),
+            match["prerelease"],
+            match["buildmetadata"],
+        )
 
-    minor_difference = _compare(
-        semantic_first_version["minor"], semantic_second_version["minor"]
-    )
-    if minor_difference:
-        return minor_difference
+    @classmethod
+    def from_dict(cls, semantic_version: dict) -> "SemanticVersion":
+        """
+        :param semantic_version: dictionary containing 'major', 'minor', 'patch', 'prerelease', 'buildmetadata' keys.
+        """
+        return cls(**semantic_version)
+
+    def to_dict(self) -> dict:
+        """
+        :return: dictionary containing 'major', 'minor', 'patch', 'prerelease', 'buildmetadata' keys.
+        """
+        return {
+            "major": self.major,
+            "minor": self.minor,
+            "patch": self.patch,
+            "prerelease": self.prerelease,
+            "buildmetadata": self.buildmetadata,
+        }
 
-    patch_difference = _compare(
-        semantic_first_version["patch"], semantic_second_version["patch"]
-    )
-    if patch_difference:
-        return patch_difference
+    def bump_major(self) -> "SemanticVersion":
+        return SemanticVersion(self.major + 1)
+
+    def bump_minor(self) -> "SemanticVersion":
+        return SemanticVersion(self.major, self.minor + 1)
+
+    def bump_patch(self) -> "SemanticVersion":
+        return SemanticVersion(self.major, self.minor, self.patch + 1)
+
+    def bump(self, unreleased: dict) -> "SemanticVersion":
+        """
+        :param unreleased: Unreleased changes (categories as keys).
+        :return: The version to use to release the changes.
+        """
+        if self.prerelease:
+            return SemanticVersion(self.major, self.minor, self.patch)
+        if contains_breaking_changes(unreleased):
+            return self.bump_major()
+        if only_contains_bug_fixes(unreleased):
+            return self.bump_patch()
+        return self.bump_minor()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SemanticVersion):
+            return self._key == other._key and self.buildmetadata == other.buildmetadata
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._key, self.buildmetadata))
+
+    def __lt__(self, other: "SemanticVersion") -> bool:
+        if isinstance(other, SemanticVersion):
+            return self._key < other._key
+        return NotImplemented
+
+    def __le__(self, other: "SemanticVersion") -> bool:
+        if isinstance(other, SemanticVersion):
+            return self._key <= other._key
+        return NotImplemented
+
+    def __gt__(self, other: "SemanticVersion") -> bool:
+        if isinstance(other, SemanticVersion):
+            return self._key > other._key
+        return NotImplemented
+
+    def __ge__(self, other: "SemanticVersion") -> bool:
+        if isinstance(other, SemanticVersion):
+            return self._key >= other._key
+        return NotImplemented
+
+    def __str__(self) -> str:
+        version = f"{self.major}.{self.minor}.{self.patch}"
+        if self.prerelease:
+            version += f"-{self.prerelease}"
+        if self.buildmetadata:
+            version += f"+{self.buildmetadata}"
+        return version
+
+    def __repr__(self) -> str:
+        return f"SemanticVersion({self.major!r}, {self.minor!r}, {self.patch!r}, {self.prerelease!r}, {self.buildmetadata!r})"
+
+
+@lru_cache(maxsize=4096)
+def prerelease_key(prerelease: Optional[str]) -> tuple:
+    """
+    Sort key of a pre-release, following https://semver.org/#spec-item-11
 
+    :param prerelease: dot separated pre-release identifiers, None if not a pre-release.
+    """
     # Ensure release is "bigger than" pre-release
-    pre_release_difference = _compare(
-        (
-            f"0{semantic_first_version['prerelease']}"
-            if semantic_first_version["prerelease"]
-            else "1"
-        ),
-        (
-            f"0{semantic_second_version['prerelease']}"
-            if semantic_second_version["prerelease"]
-            else "1"
+    if not prerelease:
+        return (1,)
+
+    return (
+        0,
+        tuple(
+            # Numeric identifiers are compared numerically and are lower than alphanumeric identifiers
+            (0, int(identifier)) if identifier.isdigit() else (1, identifier)
+            for identifier in prerelease.split(".")
         ),
     )
 
-    return pre_release_difference
-
 
 def actual_version(changelog: dict) -> tuple[Optional[str], dict]:
-    versions = to_sorted_semantic(changelog.keys())
-    return versions.pop() if versions else (None, initial_semantic_version.copy())
+    latest_version, latest_semantic_version = None, SemanticVersion()
+    for version in changelog:
+        if version == "unreleased":
+            continue
+        semantic_version = SemanticVersion.parse(version)
+        # In case of equal precedence, the last one is considered as the actual one
+        if latest_version is None or semantic_version >= latest_semantic_version:
+            latest_version, latest_semantic_version = version, semantic_version
+    return latest_version, latest_semantic_version.to_dict()
 
 
 def to_sorted_semantic(versions: Iterable[str]) -> list[tuple[str, dict]]:
@@ -126,14 +204,93 @@ def to_sorted_semantic(versions: Iterable[str]) -> list[tuple[str, dict]]:
     Each version is represented as a 2-tuple: first one is the string version, second one is a dictionary containing:
     'major', 'minor', 'patch', 'prerelease', 'buildmetadata' keys.
     """
-    return sorted(
+    semantic_versions = sorted(
         [
-            (version, to_semantic(version))
+            (version, SemanticVersion.parse(version))
             for version in versions
             if version != "unreleased"
         ],
-        key=cmp_to_key(semantic_order),
+        key=lambda version: version[1],
     )
+    return [
+        (version, semantic_version.to_dict())
+        for version, semantic_version in semantic_versions
+    ]
+
+
+class VersionIndex:
+    """
+    Releases of a changelog sorted by semantic version, to retrieve a range of releases without going through all of them.
+
+    Note: unreleased is not considered as a semantic version and will thus not be provided.
+    """
+
+    def __init__(self, changes: dict[str, dict]):
+        """
+        :param changes: python dict containing version as key and related changes as value (as returned by to_dict).
+        :raises InvalidSemanticVersion: if a version is not following semantic versioning.
+        """
+        releases = sorted(
+            [
+                (SemanticVersion.parse(version), current_release)
+                for version, current_release in changes.items()
+                if version != "unreleased"
+            ],
+            key=lambda release: release[0],
+        )
+        # Sorted from the oldest to the newest
+        self._versions = [semantic_version for semantic_version, _ in releases]
+        self._majors = [semantic_version.major for semantic_version in self._versions]
+        self._releases = [current_release for _, current_release in releases]
+
+    def since(self, version: str) -> dict[str, dict]:
+        """
+        :param version: The version to start from (it does not need to be within the changelog).
+        :return: python dict containing every version more recent than the provided one as key (newest first)
+        and related changes as value.
+        """
+        return self._slice(
+            bisect_right(self._versions, SemanticVersion.parse(version)),
+            len(self._versions),
+        )
+
+    def between(self, first_version: str, last_version: str) -> dict[str, dict]:
+        """
+        :param first_version: The oldest version of the range (included).
+        :param last_version: The newest version of the range (included).
+        :return: python dict containing every version within the range as key (newest first)
+        and related changes as value.
+        """
+        return self._slice(
+            bisect_left(self._versions, SemanticVersion.parse(first_version)),
+            bisect_right(self._versions, SemanticVersion.parse(last_version)),
+        )
+
+    def latest(self, count: int) -> dict[str, dict]:
+        """
+        :param count: Maximum number of versions to provide.
+        :return: python dict containing the most recent versions as key (newest first) and related changes as value.
+        """
+        return self._slice(max(len(self._versions) - count, 0), len(self._versions))
+
+    def latest_in_major(self, major: int) -> Optional[dict]:
+        """
+        :param major: The major version.
+        :return: The changes of the most recent version within this major version, None if there is no such version.
+        """
+        # Last version with this major (or an older one)
+        index = bisect_right(self._majors, major) - 1
+        if index >= 0 and self._majors[index] == major:
+            return self._releases[index]
+
+    def __len__(self) -> int:
+        return len(self._releases)
+
+    def _slice(self, start: int, stop: int) -> dict[str, dict]:
+        return {
+            current_release["metadata"]["version"]: current_release
+            for current_release in reversed(self._releases[start:stop])
+        }
 
 
 def guess_unreleased_version(
@@ -144,27 +301,16 @@ def guess_unreleased_version(
     unreleased = unreleased.copy()
     unreleased.pop("metadata", None)
     if unreleased:
-        return from_semantic(bump(unreleased, current_semantic_version))
+        return str(SemanticVersion.from_dict(current_semantic_version).bump(unreleased))
 
 
-semantic_versioning = re.compile(
-    r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:[-\.]?(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-)
+# Pattern is only compiled once used, to keep import fast
+@lru_cache(maxsize=None)
+def semantic_versioning() -> re.Pattern:
+    return re.compile(
+        r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:[-\.]?(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
+    )
 
 
 def to_semantic(version: Optional[str]) -> dict:
-    if not version:
-        return initial_semantic_version.copy()
-
-    match = semantic_versioning.fullmatch(version)
-    if match:
-        return {
-            key: int(value) if key in ("major", "minor", "patch") else value
-            for key, value in match.groupdict().items()
-        }
-
-    raise InvalidSemanticVersion(version)
-
-
-def from_semantic(semantic_version: dict) -> str:
-    return f"{semantic_version['major']}.{semantic_version['minor']}.{semantic_version['patch']}"
+    return SemanticVersion.parse(version).to_dict()
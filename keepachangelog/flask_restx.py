@@ -3,7 +3,7 @@ from typing import Union
 import flask_restx
 import flask
 
-from keepachangelog._changelog import to_dict
+from keepachangelog._memoized import Changelog as CachedChangelog, etag_matches
 
 
 def add_changelog_endpoint(
@@ -15,6 +15,8 @@ def add_changelog_endpoint(
     :param namespace: The Flask-RestX namespace.
     :param changelog_path: Path to CHANGELOG.md.
     """
+    # Only parse changelog again if it changed
+    cached_changelog = CachedChangelog(changelog_path)
 
     @namespace.route("/changelog")
     @namespace.doc(
@@ -78,6 +80,13 @@ def add_changelog_endpoint(
             Retrieve service changelog.
             """
             try:
-                return flask.jsonify(to_dict(changelog_path))
+                content, etag = cached_changelog.to_json()
             except FileNotFoundError:
                 return flask.jsonify({})
+
+            # Clients are expected to check that their version is still up to date
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag_matches(flask.request.headers.get("If-None-Match"), etag):
+                return flask.Response(status=304, headers=headers)
+
+            return flask.Response(content, mimetype="application/json", headers=headers)
@@ -1,8 +1,10 @@
 from typing import Callable
 
-from starlette.responses import JSONResponse
+import anyio
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
 
-from keepachangelog._changelog import to_dict
+from keepachangelog._memoized import Changelog, etag_matches
 
 
 def changelog_endpoint(changelog_path: str) -> Callable:
@@ -12,6 +14,30 @@ def changelog_endpoint(changelog_path: str) -> Callable:
     :param changelog_path: Path to CHANGELOG.md.
     :returns: The endpoint to add as a route.
     """
+    # Only parse changelog again if it changed
+    cached_changelog = Changelog(changelog_path)
+    # Set once the ongoing reading (and parsing) is over, None if there is none
+    reading = None
+
+    async def to_json() -> tuple[bytes, str]:
+        nonlocal reading
+        while True:
+            # Requests on an unchanged changelog only check the file, without waiting
+            cached = cached_changelog.cached_json()
+            if cached:
+                return cached
+            # Concurrent requests wait for the ongoing reading instead of reading the file as well
+            if not reading:
+                break
+            await reading.wait()
+
+        reading = anyio.Event()
+        try:
+            # Avoid blocking the event loop while reading and parsing the file
+            return await run_in_threadpool(cached_changelog.to_json)
+        finally:
+            reading.set()
+            reading = None
 
     async def changelog(request):
         """
@@ -26,8 +52,15 @@ def changelog_endpoint(changelog_path: str) -> Callable:
             - Monitoring
         """
         try:
-            return JSONResponse(to_dict(changelog_path))
+            content, etag = await to_json()
         except FileNotFoundError:
             return JSONResponse({})
 
+        # Clients are expected to check that their version is still up to date
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(content, media_type="application/json", headers=headers)
+
     return changelog
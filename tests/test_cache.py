@@ -0,0 +1,193 @@
+import errno
+import os
+import os.path
+import time
+
+import pytest
+
+import keepachangelog
+import keepachangelog._cache
+import keepachangelog._changelog
+
+
+@pytest.fixture
+def changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            """# Changelog
+
+## [Unreleased]
+### Added
+- Not yet released
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0) 漢字
+
+[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0
+"""
+        )
+    return changelog_file_path
+
+
+@pytest.fixture
+def cache_dir(tmpdir, monkeypatch):
+    cache_dir_path = os.path.join(tmpdir, ".keepachangelog_cache")
+    monkeypatch.setenv("KEEPACHANGELOG_CACHE_DIR", cache_dir_path)
+    return cache_dir_path
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    count = {"to_dict": 0, "to_raw_dict": 0}
+
+    def counted(name, parse):
+        def wrapper(*args):
+            count[name] += 1
+            return parse(*args)
+
+        wrapper.__qualname__ = parse.__qualname__
+        return wrapper
+
+    monkeypatch.setattr(
+        keepachangelog._changelog,
+        "_read_dict",
+        counted("to_dict", keepachangelog._changelog._read_dict),
+    )
+    monkeypatch.setattr(
+        keepachangelog._changelog,
+        "_read_raw",
+        counted("to_raw_dict", keepachangelog._changelog._read_raw),
+    )
+    return count
+
+
+def test_cache_is_disabled_by_default(changelog, parse_count):
+    assert keepachangelog.to_dict(changelog) == keepachangelog.to_dict(changelog)
+    assert parse_count["to_dict"] == 2
+
+
+def test_cached_to_dict(changelog, cache_dir, parse_count):
+    changes = keepachangelog.to_dict(changelog)
+    assert keepachangelog.to_dict(changelog) == changes
+    assert keepachangelog.to_dict(changelog) is not changes
+    assert parse_count["to_dict"] == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cached_to_dict_depends_on_parameters(changelog, cache_dir, parse_count):
+    assert keepachangelog.to_dict(changelog) != keepachangelog.to_dict(
+        changelog, show_unreleased=True
+    )
+    assert parse_count["to_dict"] == 2
+
+
+def test_cached_to_raw_dict(changelog, cache_dir, parse_count):
+    changes = keepachangelog.to_raw_dict(changelog)
+    assert keepachangelog.to_raw_dict(changelog) == changes
+    assert parse_count["to_raw_dict"] == 1
+
+
+def test_cache_is_updated_on_modification(changelog, cache_dir, parse_count):
+    keepachangelog.to_dict(changelog)
+    with open(changelog, mode="at", encoding="utf-8") as file:
+        file.write(
+            "[1.0.1]: https://github.test_url/test_project/releases/tag/v1.0.1\n"
+        )
+
+    assert "1.0.1" in keepachangelog.to_dict(changelog)
+    assert parse_count["to_dict"] == 2
+    # Stale entry was replaced
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cache_is_used_if_only_modification_time_changed(
+    changelog, cache_dir, parse_count
+):
+    changes = keepachangelog.to_dict(changelog)
+    os.utime(changelog, ns=(0, 0))
+
+    assert keepachangelog.to_dict(changelog) == changes
+    assert keepachangelog.to_dict(changelog) == changes
+    assert parse_count["to_dict"] == 1
+
+
+def test_cache_is_updated_if_content_changed_with_same_size(
+    changelog, cache_dir, parse_count
+):
+    keepachangelog.to_dict(changelog)
+    with open(changelog, encoding="utf-8") as file:
+        content = file.read()
+    with open(changelog, mode="wt", encoding="utf-8") as file:
+        file.write(content.replace("1.0.0", "2.0.0"))
+    os.utime(changelog, ns=(0, 0))
+
+    assert "2.0.0" in keepachangelog.to_dict(changelog)
+    assert parse_count["to_dict"] == 2
+
+
+def test_corrupted_cache_entry(changelog, cache_dir, parse_count):
+    keepachangelog.to_dict(changelog)
+    for entry in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, entry), mode="wb") as file:
+            file.write(b"corrupted")
+
+    assert "1.0.0" in keepachangelog.to_dict(changelog)
+    assert parse_count["to_dict"] == 2
+
+
+def test_old_cache_entries_are_evicted(changelog, cache_dir, parse_count):
+    os.makedirs(cache_dir)
+    old_entry = os.path.join(cache_dir, "old.cache")
+    open(old_entry, mode="wb").close()
+    old = time.time() - keepachangelog._cache.max_entry_age - 1
+    os.utime(old_entry, (old, old))
+    not_an_entry = os.path.join(cache_dir, "not_an_entry")
+    open(not_an_entry, mode="wb").close()
+    os.utime(not_an_entry, (old, old))
+
+    keepachangelog.to_dict(changelog)
+    assert not os.path.exists(old_entry)
+    assert os.path.exists(not_an_entry)
+
+
+def test_cached_changelog_not_found(cache_dir):
+    with pytest.raises(FileNotFoundError):
+        keepachangelog.to_dict("do not exists")
+
+
+def test_cache_dir_under_a_file(changelog, tmpdir, monkeypatch):
+    not_a_directory = os.path.join(tmpdir, "not_a_directory")
+    open(not_a_directory, mode="wb").close()
+    monkeypatch.setenv(
+        "KEEPACHANGELOG_CACHE_DIR", os.path.join(not_a_directory, "cache")
+    )
+
+    assert "1.0.0" in keepachangelog.to_dict(changelog)
+    assert "1.0.0" in keepachangelog.to_raw_dict(changelog)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="Directory permissions are not enforced",
+)
+def test_unwritable_cache_dir(changelog, cache_dir):
+    os.makedirs(cache_dir)
+    os.chmod(cache_dir, 0o500)
+    try:
+        assert "1.0.0" in keepachangelog.to_dict(changelog)
+        assert os.listdir(cache_dir) == []
+    finally:
+        os.chmod(cache_dir, 0o700)
+
+
+def test_cache_entry_cannot_be_written(changelog, cache_dir, monkeypatch):
+    def dump(value, file):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(keepachangelog._cache.marshal, "dump", dump)
+
+    assert "1.0.0" in keepachangelog.to_dict(changelog)
+    # Temporary entry is removed
+    assert os.listdir(cache_dir) == []
@@ -5,6 +5,7 @@ import os.path
 import pytest
 
 import keepachangelog
+import keepachangelog._changelog
 
 
 @pytest.fixture
@@ -284,3 +285,171 @@ def test_raw_changelog_with_versions_and_all_categories(changelog):
             },
         },
     }
+
+
+def test_find_raw_release(changelog):
+    raw_release = keepachangelog.to_raw_dict(changelog)["1.1.0"]
+    raw_release["metadata"].pop("url")
+    assert keepachangelog.find_raw_release(changelog, "1.1.0") == raw_release
+
+
+def test_find_raw_release_without_section(changelog):
+    assert not keepachangelog.find_raw_release(changelog, "1.0.2")
+
+
+def test_find_raw_unreleased(changelog):
+    assert not keepachangelog.find_raw_release(changelog, "Unreleased")
+
+
+repeated_release_changelog = """## [1.1.0] - 2018-05-31
+### Added
+- a
+## [1.1.0] - 2018-05-31
+### Fixed
+- b
+## [1.0.0] - 2017-04-10
+### Added
+- c
+## [1.1.0] - 2018-05-31
+### Removed
+- d
+"""
+
+
+def test_find_raw_release_merges_following_sections(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(repeated_release_changelog)
+
+    assert (
+        keepachangelog.find_raw_release(changelog_file_path, "1.1.0")["raw"]
+        == "### Added\n- a\n### Fixed\n- b\n"
+    )
+    # Unlike find_raw_release, to_raw_dict also merges sections found after another release
+    assert (
+        keepachangelog.to_raw_dict(changelog_file_path)["1.1.0"]["raw"]
+        == "### Added\n- a\n### Fixed\n- b\n### Removed\n- d\n"
+    )
+
+
+def test_iter_raw_releases(changelog):
+    raw_releases = keepachangelog.to_raw_dict(changelog)
+    for raw_release in raw_releases.values():
+        raw_release["metadata"].pop("url", None)
+    assert list(keepachangelog.iter_raw_releases(changelog)) == [
+        raw_releases["1.2.0"],
+        raw_releases["1.1.0"],
+        raw_releases["1.0.1"],
+        raw_releases["1.0.0"],
+    ]
+
+
+def test_iter_raw_releases_since(changelog):
+    raw_releases = keepachangelog.to_raw_dict(changelog)
+    for raw_release in raw_releases.values():
+        raw_release["metadata"].pop("url", None)
+    assert list(keepachangelog.iter_raw_releases(changelog, since="1.0.1")) == [
+        raw_releases["1.2.0"],
+        raw_releases["1.1.0"],
+    ]
+    # Version not within the changelog
+    assert list(keepachangelog.iter_raw_releases(changelog, since="1.0.2")) == [
+        raw_releases["1.2.0"],
+        raw_releases["1.1.0"],
+    ]
+    assert list(keepachangelog.iter_raw_releases(changelog, since="1.2.0")) == []
+    assert len(list(keepachangelog.iter_raw_releases(changelog, since="0.1.0"))) == 4
+
+
+def test_iter_raw_releases_since_non_semantic_version(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            "## [2.0.0] - 2018-06-01\n"
+            "## [Beta] - 2018-05-31\n"
+            "## [1.0.0] - 2017-04-10\n"
+        )
+    assert [
+        raw_release["metadata"]["version"]
+        for raw_release in keepachangelog.iter_raw_releases(
+            changelog_file_path, since="beta"
+        )
+    ] == ["2.0.0"]
+    assert [
+        raw_release["metadata"]["version"]
+        for raw_release in keepachangelog.iter_raw_releases(
+            changelog_file_path, since="1.5.0"
+        )
+    ] == ["2.0.0", "beta"]
+
+
+def test_iter_raw_releases_since_stops_reading(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wb") as file:
+        file.write(b"## [1.1.0] - 2018-05-31\n### Added\n- Enhancement 1\n")
+        file.write(b"## [1.0.0] - 2017-04-10\n")
+        file.write(b"- Known issue\n" * 100_000)
+        # Invalid UTF-8 content cannot be read
+        file.write(b"\xff\n")
+    assert list(
+        keepachangelog.iter_raw_releases(changelog_file_path, since="1.0.0")
+    ) == [
+        {
+            "raw": "### Added\n- Enhancement 1\n",
+            "metadata": {
+                "release_date": "2018-05-31",
+                "version": "1.1.0",
+                "semantic_version": {
+                    "buildmetadata": None,
+                    "major": 1,
+                    "minor": 1,
+                    "patch": 0,
+                    "prerelease": None,
+                },
+            },
+        }
+    ]
+
+
+def test_raw_changelog_with_many_lines(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    lines = [f"- Release note {index}\n" for index in range(10_000)]
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write("## [1.0.0] - 2017-04-10\n### Added\n")
+        file.writelines(lines)
+        file.write("\n## [1.0.0] - 2017-04-10\n### Fixed\n- Bug fix 1\n")
+
+    assert (
+        keepachangelog.to_raw_dict(changelog_file_path)["1.0.0"]["raw"]
+        == "### Added\n" + "".join(lines) + "### Fixed\n- Bug fix 1\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "line, kind",
+    [
+        ("## [1.0.0] - 2017-04-10", "release"),
+        ("## Unreleased", "release"),
+        ("### Added", "category"),
+        ("[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0", "link"),
+        ("# Changelog", "information"),
+        ("#### Sub category", "information"),
+        ("##Not a release", "information"),
+        ("[1.0.0] is not a link", "information"),
+        ("- Release note", "information"),
+        ("", "empty"),
+    ],
+)
+def test_classify(line, kind):
+    assert keepachangelog._changelog.classify(line)[0] == kind
+
+
+def test_classify_link():
+    kind, link_match = keepachangelog._changelog.classify(
+        "[Unreleased]: https://github.test_url/test_project/compare/v1.1.0...HEAD"
+    )
+    assert kind == "link"
+    assert link_match.groups() == (
+        "Unreleased",
+        "https://github.test_url/test_project/compare/v1.1.0...HEAD",
+    )
@@ -0,0 +1,85 @@
+import mmap
+import os
+import os.path
+
+import pytest
+
+import keepachangelog
+
+changelog_content = """# Changelog
+All notable changes to this project will be documented in this file.
+
+## [Unreleased]
+### Added
+- Not yet released
+
+## [1.2.0] - 2018-06-01
+Uncategorized information
+### Changed
+- Release note 1.
+ * Release note 2. -
+
+### Added
+- Enhancement 1 漢字
+- [Link](https://keepachangelog.com) is not a release link
+
+#### Not a category
+[1.2.0] is not a link either
+
+## 1.1.0 - 2018-05-31
+### Fixed
+- Bug fix 1 (1.1.0)
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0)
+
+[Unreleased]: https://github.test_url/test_project/compare/v1.2.0...HEAD
+[1.2.0]: https://github.test_url/test_project/compare/v1.1.0...v1.2.0
+[1.1.0]: https://github.test_url/test_project/compare/v1.0.0...v1.1.0
+[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0
+[0.0.1]: https://github.test_url/test_project/releases/tag/v0.0.1
+"""
+
+
+@pytest.fixture
+def changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(changelog_content)
+    return changelog_file_path
+
+
+@pytest.mark.parametrize("show_unreleased", [False, True])
+def test_bytes_to_dict(changelog, show_unreleased):
+    assert keepachangelog.bytes_to_dict(
+        changelog_content.encode("utf-8"), show_unreleased=show_unreleased
+    ) == keepachangelog.to_dict(changelog, show_unreleased=show_unreleased)
+
+
+@pytest.mark.parametrize("line_ending", ["\r\n", "\r"])
+def test_bytes_to_dict_with_other_line_endings(changelog, line_ending):
+    assert keepachangelog.bytes_to_dict(
+        changelog_content.replace("\n", line_ending).encode("utf-8")
+    ) == keepachangelog.to_dict(changelog)
+
+
+def test_memoryview_to_dict(changelog):
+    content = bytearray(changelog_content.encode("utf-8"))
+    assert keepachangelog.bytes_to_dict(memoryview(content)) == keepachangelog.to_dict(
+        changelog
+    )
+
+
+def test_mmap_to_dict(changelog):
+    with (
+        open(changelog, mode="rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content,
+    ):
+        assert keepachangelog.bytes_to_dict(content) == keepachangelog.to_dict(
+            changelog
+        )
+
+
+def test_empty_bytes_to_dict():
+    assert keepachangelog.bytes_to_dict(b"") == {}
@@ -0,0 +1,113 @@
+import pytest
+
+import keepachangelog
+
+changelog_content = """# Changelog
+All notable changes to this project will be documented in this file.
+
+[1.2.0]: https://github.test_url/test_project/compare/v1.1.0...v1.2.0
+
+## [Unreleased]
+### Added
+- Not yet released
+
+## [1.2.0] - 2018-06-01
+Uncategorized information
+### Changed
+- Release note 1.
+ * Release note 2. -
+
+### Added
+- Enhancement 1 漢字
+- [Link](https://keepachangelog.com) is not a release link
+
+#### Not a category
+[1.2.0] is not a link either
+  ## 1.1.0 - 2018-05-31
+### Fixed
+- Bug fix 1 (1.1.0)
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0)
+
+[Unreleased]: https://github.test_url/test_project/compare/v1.2.0...HEAD
+[1.1.0]: https://github.test_url/test_project/compare/v1.0.0...v1.1.0
+
+[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0
+[0.0.1]: https://github.test_url/test_project/releases/tag/v0.0.1
+"""
+
+edits = [
+    # Unreleased changes
+    lambda content: content.replace("- Not yet released", "- Not yet released\n- 2"),
+    # Release of a new version
+    lambda content: content.replace(
+        "## [Unreleased]", "## [Unreleased]\n\n## [1.3.0] - 2018-06-02"
+    ),
+    # Link update
+    lambda content: content.replace("v1.2.0...HEAD", "v1.3.0...HEAD"),
+    # Link removal
+    lambda content: content.replace("[1.1.0]: ", ""),
+    # Information ending the changelog
+    lambda content: content + "Not a link\n",
+    # Same version released twice
+    lambda content: content + "## [1.0.0] - 2017-04-11\n### Added\n- Duplicate\n",
+    # Windows line endings
+    lambda content: content.replace("\n", "\r\n"),
+    # Old Mac line endings
+    lambda content: content.replace("\n", "\r"),
+    # Empty changelog
+    lambda content: "",
+    # Title without text is not a release
+    lambda content: content.replace("- Known issue 1", "## \n- Known issue 1"),
+    lambda content: content.replace("\n- Bug fix 1 (1.1.0)", "\n##   \n- Bug fix"),
+]
+
+
+@pytest.mark.parametrize("show_unreleased", [False, True])
+@pytest.mark.parametrize("edit", edits)
+def test_incremental_parsing(edit, show_unreleased):
+    parser = keepachangelog.IncrementalParser(show_unreleased=show_unreleased)
+    for content in (changelog_content, edit(changelog_content), changelog_content):
+        content = content.encode("utf-8")
+        assert parser.to_dict(content) == keepachangelog.bytes_to_dict(
+            content, show_unreleased=show_unreleased
+        )
+
+
+def test_unchanged_releases_are_shared():
+    parser = keepachangelog.IncrementalParser(show_unreleased=True)
+    changes = parser.to_dict(changelog_content.encode("utf-8"))
+    new_changes = parser.to_dict(
+        changelog_content.replace("Not yet released", "Not yet").encode("utf-8")
+    )
+    assert new_changes["unreleased"] is not changes["unreleased"]
+    assert new_changes["unreleased"]["added"] == ["Not yet"]
+    assert changes["unreleased"]["added"] == ["Not yet released"]
+    assert new_changes["1.2.0"] is changes["1.2.0"]
+    assert new_changes["1.1.0"] is changes["1.1.0"]
+    assert new_changes["1.0.0"] is changes["1.0.0"]
+
+
+def test_release_url_change():
+    parser = keepachangelog.IncrementalParser()
+    changes = parser.to_dict(changelog_content.encode("utf-8"))
+    new_changes = parser.to_dict(
+        changelog_content.replace("releases/tag/v1.0.0", "tag/v1.0.0").encode("utf-8")
+    )
+    assert new_changes["1.0.0"] is not changes["1.0.0"]
+    assert new_changes["1.0.0"]["metadata"]["url"] == (
+        "https://github.test_url/test_project/tag/v1.0.0"
+    )
+    assert changes["1.0.0"]["metadata"]["url"] == (
+        "https://github.test_url/test_project/releases/tag/v1.0.0"
+    )
+    assert new_changes["1.2.0"] is changes["1.2.0"]
+
+
+def test_title_without_text():
+    content = b"## [1.0.0] - 2020\n### Added\n- a\n## \n- b\n"
+    changes = keepachangelog.IncrementalParser().to_dict(content)
+    assert changes == keepachangelog.bytes_to_dict(content)
+    assert changes["1.0.0"]["added"] == ["a", "##", "b"]
@@ -0,0 +1,137 @@
+import os
+import os.path
+
+import pytest
+
+import keepachangelog
+
+
+@pytest.fixture
+def changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            """# Changelog
+All notable changes to this project will be documented in this file.
+
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+
+## [Unreleased]
+### Added
+- Not yet released
+
+## [1.1.0] - 2018-05-31
+Uncategorized information
+### Changed
+- Enhancement 1 (1.1.0)
+- sub enhancement 1
+
+## [1.0.1] - 2018-05-31
+### Fixed
+- Bug fix 1 (1.0.1) 漢字
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0)
+
+[Unreleased]: https://github.test_url/test_project/compare/v1.1.0...HEAD
+[1.1.0]: https://github.test_url/test_project/compare/v1.0.2...v1.1.0
+[1.0.2]: https://github.test_url/test_project/compare/v1.0.1...v1.0.2
+[1.0.1]: https://github.test_url/test_project/compare/v1.0.0...v1.0.1
+"""
+        )
+    return changelog_file_path
+
+
+def test_iter_releases_is_ordered_as_to_dict(changelog):
+    assert list(keepachangelog.iter_releases(changelog)) == list(
+        keepachangelog.to_dict(changelog).values()
+    )
+
+
+def test_iter_releases_with_unreleased_is_ordered_as_to_dict(changelog):
+    assert list(keepachangelog.iter_releases(changelog, show_unreleased=True)) == list(
+        keepachangelog.to_dict(changelog, show_unreleased=True).values()
+    )
+
+
+def test_iter_releases_as_file_reader(changelog):
+    with open(changelog, encoding="utf-8") as file:
+        assert list(keepachangelog.iter_releases(file)) == list(
+            keepachangelog.to_dict(changelog).values()
+        )
+
+
+def test_iter_releases_provides_release_once_section_is_read(changelog):
+    read_lines = []
+
+    def lines():
+        with open(changelog, encoding="utf-8") as file:
+            for line in file:
+                read_lines.append(line)
+                yield line
+
+    releases = keepachangelog.iter_releases(lines())
+    first_release = next(releases)
+    assert first_release == {
+        "changed": ["Enhancement 1 (1.1.0)", "sub enhancement 1"],
+        "uncategorized": ["Uncategorized information"],
+        "metadata": {
+            "release_date": "2018-05-31",
+            "version": "1.1.0",
+            "semantic_version": {
+                "buildmetadata": None,
+                "major": 1,
+                "minor": 1,
+                "patch": 0,
+                "prerelease": None,
+            },
+        },
+    }
+    # File was only read up to the next release
+    assert read_lines[-1] == "## [1.0.1] - 2018-05-31\n"
+
+    # URL is set once links are read
+    assert [release["metadata"]["version"] for release in releases] == [
+        "1.0.1",
+        "1.0.0",
+        "1.0.2",
+    ]
+    assert (
+        first_release["metadata"]["url"]
+        == "https://github.test_url/test_project/compare/v1.0.2...v1.1.0"
+    )
+
+
+def test_iter_releases_with_link_before_release():
+    assert list(
+        keepachangelog.iter_releases(
+            [
+                "### Added\n",
+                "- Ignored as there is no release yet\n",
+                "[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0\n",
+                "## [1.0.0] - 2017-04-10\n",
+            ]
+        )
+    ) == [
+        {
+            "metadata": {
+                "release_date": "2017-04-10",
+                "version": "1.0.0",
+                "semantic_version": {
+                    "buildmetadata": None,
+                    "major": 1,
+                    "minor": 0,
+                    "patch": 0,
+                    "prerelease": None,
+                },
+                "url": "https://github.test_url/test_project/releases/tag/v1.0.0",
+            },
+        }
+    ]
+
+
+def test_iter_releases_not_found():
+    with pytest.raises(FileNotFoundError):
+        next(keepachangelog.iter_releases("do not exists"))
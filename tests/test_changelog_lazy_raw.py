@@ -0,0 +1,103 @@
+import os
+import os.path
+
+import pytest
+
+import keepachangelog
+
+changelog_content = """# Changelog
+All notable changes to this project will be documented in this file.
+
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+
+## [Unreleased]
+### Added
+- Not yet released
+
+## [1.1.0] - 2018-05-31
+### Changed
+- Enhancement 1 (1.1.0) 漢字
+ - sub enhancement 1
+
+### Fixed
+- Bug fix 1 (1.1.0)
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0)
+
+[Unreleased]: https://github.test_url/test_project/compare/v1.1.0...HEAD
+[1.1.0]: https://github.test_url/test_project/compare/v1.0.1...v1.1.0
+[1.0.1]: https://github.test_url/test_project/compare/v1.0.0...v1.0.1
+"""
+
+
+@pytest.fixture
+def changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8", newline="\n") as file:
+        file.write(changelog_content)
+    return changelog_file_path
+
+
+@pytest.fixture
+def windows_changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8", newline="\r\n") as file:
+        file.write(changelog_content)
+    return changelog_file_path
+
+
+def test_lazy_raw_changelog(changelog):
+    assert keepachangelog.to_raw_dict(
+        changelog, lazy=True
+    ) == keepachangelog.to_raw_dict(changelog)
+
+
+def test_lazy_raw_changelog_with_windows_line_endings(windows_changelog):
+    assert keepachangelog.to_raw_dict(
+        windows_changelog, lazy=True
+    ) == keepachangelog.to_raw_dict(windows_changelog)
+
+
+def test_lazy_raw_content(changelog):
+    raw = keepachangelog.to_raw_dict(changelog, lazy=True)["1.1.0"]["raw"]
+    expected = """### Changed
+- Enhancement 1 (1.1.0) 漢字
+ - sub enhancement 1
+### Fixed
+- Bug fix 1 (1.1.0)
+"""
+    assert str(raw) == expected
+    assert repr(raw) == repr(expected)
+    assert hash(raw) == hash(expected)
+    assert raw != 1
+
+
+def test_lazy_raw_empty_changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    open(changelog_file_path, mode="wb").close()
+
+    assert keepachangelog.to_raw_dict(changelog_file_path, lazy=True) == {}
+
+
+def test_lazy_raw_changelog_as_context_manager(changelog):
+    with keepachangelog.to_raw_dict(changelog, lazy=True) as changes:
+        raw = changes["1.1.0"]["raw"]
+        assert str(raw).startswith("### Changed\n")
+
+    # File can then be modified in place without any impact on the interpreter
+    with open(changelog, mode="wt", encoding="utf-8") as file:
+        file.write("")
+    with pytest.raises(ValueError):
+        str(raw)
+
+
+def test_lazy_raw_empty_changelog_close(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    open(changelog_file_path, mode="wb").close()
+
+    changes = keepachangelog.to_raw_dict(changelog_file_path, lazy=True)
+    changes.close()
+    assert changes == {}
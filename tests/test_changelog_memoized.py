@@ -0,0 +1,163 @@
+import json
+import os
+import os.path
+
+import pytest
+
+import keepachangelog
+import keepachangelog._incremental
+
+
+@pytest.fixture
+def changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            """# Changelog
+
+## [Unreleased]
+### Added
+- Not yet released
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0)
+"""
+        )
+    return changelog_file_path
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    count = []
+
+    parser_to_dict = keepachangelog._incremental.IncrementalParser.to_dict
+
+    def to_dict(self, content):
+        count.append(content)
+        return parser_to_dict(self, content)
+
+    monkeypatch.setattr(
+        keepachangelog._incremental.IncrementalParser, "to_dict", to_dict
+    )
+    return count
+
+
+def add_release(changelog_path: str) -> None:
+    with open(changelog_path, mode="at", encoding="utf-8") as file:
+        file.write("\n## [0.0.1] - 2017-04-09\n")
+
+
+def test_changelog_is_parsed_once(changelog, parse_count):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    assert cached_changelog.to_dict() == keepachangelog.to_dict(changelog)
+    assert cached_changelog.to_dict() is cached_changelog.to_dict()
+    assert len(parse_count) == 1
+
+
+def test_changelog_with_unreleased(changelog):
+    cached_changelog = keepachangelog.Changelog(changelog, show_unreleased=True)
+    assert cached_changelog.to_dict() == keepachangelog.to_dict(
+        changelog, show_unreleased=True
+    )
+
+
+def test_changelog_is_parsed_again_on_modification(changelog, parse_count):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    assert list(cached_changelog.to_dict()) == ["1.0.0"]
+    add_release(changelog)
+    assert list(cached_changelog.to_dict()) == ["1.0.0", "0.0.1"]
+    assert len(parse_count) == 2
+
+
+def test_changelog_is_not_checked_within_ttl(changelog, parse_count):
+    cached_changelog = keepachangelog.Changelog(changelog, ttl=3600)
+    assert list(cached_changelog.to_dict()) == ["1.0.0"]
+    add_release(changelog)
+    assert list(cached_changelog.to_dict()) == ["1.0.0"]
+    assert len(parse_count) == 1
+
+
+def test_changelog_not_found():
+    with pytest.raises(FileNotFoundError):
+        keepachangelog.Changelog("do not exists").to_dict()
+
+
+def test_changelog_to_json(changelog):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    content, etag = cached_changelog.to_json()
+    assert json.loads(content) == keepachangelog.to_dict(changelog)
+    assert cached_changelog.to_json() == (content, etag)
+
+    add_release(changelog)
+    new_content, new_etag = cached_changelog.to_json()
+    assert new_etag != etag
+    assert json.loads(new_content) == keepachangelog.to_dict(changelog)
+
+
+def test_changelog_cached_json(changelog, parse_count):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    assert cached_changelog.cached_json() is None
+    assert len(parse_count) == 0
+
+    content, etag = cached_changelog.to_json()
+    assert cached_changelog.cached_json() == (content, etag)
+
+    add_release(changelog)
+    assert cached_changelog.cached_json() is None
+    assert len(parse_count) == 1
+
+
+def test_changelog_cached_json_does_not_wait(changelog):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    cached_changelog.to_json()
+    with cached_changelog._lock:
+        assert cached_changelog.cached_json() is None
+
+
+def test_changelog_is_not_parsed_again_if_content_did_not_change(
+    changelog, parse_count
+):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    _, etag = cached_changelog.to_json()
+    os.utime(changelog, ns=(0, 0))
+    assert cached_changelog.to_json()[1] == etag
+    assert len(parse_count) == 1
+
+
+def test_changelog_find_raw_release(changelog):
+    cached_changelog = keepachangelog.Changelog(changelog)
+    assert cached_changelog.find_raw_release(
+        "1.0.0"
+    ) == keepachangelog.find_raw_release(changelog, "1.0.0")
+    assert cached_changelog.find_raw_release(
+        "1.0.0"
+    ) is cached_changelog.find_raw_release("1.0.0")
+    assert cached_changelog.find_raw_release("unreleased") is None
+
+
+def test_changelog_find_raw_release_merges_following_sections(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            """## [1.1.0] - 2018-05-31
+### Added
+- a
+## [1.1.0] - 2018-05-31
+### Fixed
+- b
+## [1.0.0] - 2017-04-10
+### Added
+- c
+## [1.1.0] - 2018-05-31
+### Removed
+- d
+"""
+        )
+    cached_changelog = keepachangelog.Changelog(changelog_file_path)
+    assert cached_changelog.find_raw_release(
+        "1.1.0"
+    ) == keepachangelog.find_raw_release(changelog_file_path, "1.1.0")
+    assert cached_changelog.find_raw_release("1.1.0")["raw"] == (
+        "### Added\n- a\n### Fixed\n- b\n"
+    )
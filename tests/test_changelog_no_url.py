@@ -1,3 +1,5 @@
+import io
+
 import keepachangelog
 
 
@@ -139,3 +141,9 @@ changelog_as_dict = {
 
 def test_changelog_dont_have_2_newline_at_eof():
     assert keepachangelog.from_dict(changelog_as_dict) == changelog_as_text
+
+
+def test_changelog_write_dict():
+    file = io.StringIO()
+    keepachangelog.write_dict(changelog_as_dict, file)
+    assert file.getvalue() == changelog_as_text
@@ -0,0 +1,115 @@
+import os
+import os.path
+
+import pytest
+
+import keepachangelog
+import keepachangelog._batch
+
+
+def write_changelog(tmpdir, content: str, newline: str = "\n") -> str:
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(
+        changelog_file_path, mode="wt", encoding="utf-8", newline=newline
+    ) as file:
+        file.write(content)
+    return changelog_file_path
+
+
+def changelog_content(release_count: int) -> str:
+    releases = "".join(
+        f"""## [1.{index}.0] - 2020-01-01
+Uncategorized information
+### Added
+- Enhancement {index} 漢字
+#### Not a category
+### Fixed
+- Bug fix {index}
+
+"""
+        for index in range(release_count, 0, -1)
+    )
+    links = "".join(
+        f"[1.{index}.0]: https://github.test_url/test_project/releases/tag/v1.{index}.0\n"
+        for index in range(release_count + 1, 0, -1)
+    )
+    return f"""# Changelog
+[Unreleased]: https://github.test_url/test_project/compare/v1.{release_count}.0...HEAD
+
+## [Unreleased]
+### Added
+- Not yet released
+
+{releases}
+{links}"""
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(keepachangelog._batch, "min_chunk_size", 1_000)
+
+
+@pytest.mark.parametrize("show_unreleased", [False, True])
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_parallel_to_dict(tmpdir, small_chunks, show_unreleased, newline):
+    changelog = write_changelog(tmpdir, changelog_content(50), newline)
+    assert keepachangelog.parallel_to_dict(
+        changelog, show_unreleased=show_unreleased, max_workers=4
+    ) == keepachangelog.to_dict(changelog, show_unreleased=show_unreleased)
+
+
+def test_parallel_to_dict_is_ordered_as_to_dict(tmpdir, small_chunks):
+    changelog = write_changelog(tmpdir, changelog_content(50))
+    assert list(keepachangelog.parallel_to_dict(changelog, max_workers=4)) == list(
+        keepachangelog.to_dict(changelog)
+    )
+
+
+def test_parallel_to_dict_with_same_version_in_different_chunks(tmpdir, small_chunks):
+    changelog = write_changelog(
+        tmpdir,
+        changelog_content(50) + "## [1.50.0] - 2020-01-01\n### Removed\n- Feature\n",
+    )
+    changes = keepachangelog.parallel_to_dict(changelog, max_workers=4)
+    assert changes == keepachangelog.to_dict(changelog)
+    assert changes["1.50.0"]["removed"] == ["Feature"]
+
+
+def test_parallel_to_dict_without_release_to_split_on(tmpdir, small_chunks):
+    changelog = write_changelog(
+        tmpdir, "## [1.0.0] - 2020-01-01\n" + "- Enhancement\n" * 1_000
+    )
+    assert keepachangelog.parallel_to_dict(
+        changelog, max_workers=4
+    ) == keepachangelog.to_dict(changelog)
+
+
+def test_parallel_to_dict_small_changelog(tmpdir):
+    changelog = write_changelog(tmpdir, changelog_content(50))
+    assert keepachangelog.parallel_to_dict(changelog) == keepachangelog.to_dict(
+        changelog
+    )
+
+
+def test_parallel_to_dict_empty_changelog(tmpdir, small_chunks):
+    changelog = write_changelog(tmpdir, "")
+    assert keepachangelog.parallel_to_dict(changelog, max_workers=4) == {}
+
+
+def test_parse_chunk(tmpdir):
+    changelog = write_changelog(
+        tmpdir, "# Changelog\n## [1.0.0] - 2020-01-01\n### Added\n- Feature\n", "\r\n"
+    )
+    changes, urls = keepachangelog._batch._parse_chunk(changelog, 13, 60)
+    assert list(changes) == ["1.0.0"]
+    assert changes["1.0.0"]["added"] == ["Feature"]
+    assert urls == {}
+
+
+def test_parallel_to_dict_with_title_without_text(tmpdir, monkeypatch):
+    monkeypatch.setattr(keepachangelog._batch, "min_chunk_size", 1)
+    changelog = write_changelog(tmpdir, "## [1.0.0] - 2020\n### Added\n- a\n## \n- b\n")
+
+    changes = keepachangelog.parallel_to_dict(changelog, max_workers=2)
+    assert changes == keepachangelog.to_dict(changelog)
+    assert changes["1.0.0"]["added"] == ["a", "##", "b"]
@@ -1,6 +1,7 @@
 import datetime
 import os
 import os.path
+import threading
 
 import pytest
 
@@ -1101,3 +1102,151 @@ A description is worth a thousand patches.
 - Enhancement
 """
         )
+
+
+def test_release_reads_changelog_once(major_changelog, mock_date, monkeypatch):
+    opened = []
+
+    def tracked_open(file, mode="r", **kwargs):
+        opened.append(mode)
+        return open(file, mode, **kwargs)
+
+    monkeypatch.setattr(keepachangelog._changelog, "open", tracked_open, raising=False)
+    assert keepachangelog.release(major_changelog) == "2.0.0"
+    assert opened == ["rb", "wb"]
+
+
+def test_release_version(major_changelog, mock_date):
+    keepachangelog._changelog.release_version(major_changelog, "1.1.0", "1.2.0")
+    with open(major_changelog, encoding="utf-8") as file:
+        content = file.read()
+    assert "## [Unreleased]\n\n## [1.2.0] - 2021-03-19\n" in content
+    assert (
+        "[Unreleased]: https://github.test_url/test_project/compare/v1.2.0...HEAD\n"
+        "[1.2.0]: https://github.test_url/test_project/compare/v1.1.0...v1.2.0\n"
+    ) in content
+
+
+def test_release_keeps_file_permissions(major_changelog, mock_date):
+    os.chmod(major_changelog, 0o640)
+    assert keepachangelog.release(major_changelog) == "2.0.0"
+    assert os.stat(major_changelog).st_mode & 0o777 == 0o640
+
+
+def test_release_through_symbolic_link(major_changelog, mock_date, tmpdir):
+    link_path = os.path.join(tmpdir, "LINK_TO_CHANGELOG.md")
+    os.symlink(major_changelog, link_path)
+    assert keepachangelog.release(link_path) == "2.0.0"
+    assert os.path.islink(link_path)
+    with open(major_changelog, encoding="utf-8") as file:
+        assert "## [2.0.0] - 2021-03-19" in file.read()
+
+
+def test_failed_release_does_not_modify_changelog(
+    major_changelog, mock_date, monkeypatch
+):
+    with open(major_changelog, encoding="utf-8") as file:
+        content = file.read()
+    changelog_files = os.listdir(os.path.dirname(major_changelog))
+
+    def failing_replace(source, destination):
+        raise OSError("Interrupted")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        keepachangelog.release(major_changelog)
+
+    with open(major_changelog, encoding="utf-8") as file:
+        assert file.read() == content
+    # Temporary file was removed
+    assert os.listdir(os.path.dirname(major_changelog)) == changelog_files
+
+
+def test_locked_release_waits_for_other_release(major_changelog, mock_date):
+    new_versions = []
+    release_thread = threading.Thread(
+        target=lambda: new_versions.append(
+            keepachangelog.release(major_changelog, lock=True)
+        )
+    )
+    with keepachangelog._changelog._locked(major_changelog):
+        release_thread.start()
+        release_thread.join(timeout=0.2)
+        assert release_thread.is_alive()
+        assert not new_versions
+
+    release_thread.join()
+    assert new_versions == ["2.0.0"]
+    assert os.path.exists(f"{major_changelog}.lock")
+
+
+def test_release_keeps_windows_line_endings(tmpdir, mock_date):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wb") as file:
+        file.write(
+            b"# Changelog\r\n"
+            b"## [Unreleased]\r\n"
+            b"### Fixed\r\n"
+            b"- Mentioning [Unreleased]: is not a link.\r\n"
+            b"\r\n"
+            b"## [1.0.0] - 2020-01-01\r\n"
+            b"### Added\r\n"
+            b"- Initial release.\r\n"
+            b"\r\n"
+            b"[Unreleased]: https://github.test_url/test_project/compare/v1.0.0...HEAD\r\n"
+            b"[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0\r\n"
+        )
+
+    assert keepachangelog.release(changelog_file_path) == "1.0.1"
+    with open(changelog_file_path, mode="rb") as file:
+        assert file.read() == (
+            b"# Changelog\r\n"
+            b"## [Unreleased]\r\n"
+            b"\r\n"
+            b"## [1.0.1] - 2021-03-19\r\n"
+            b"### Fixed\r\n"
+            b"- Mentioning [Unreleased]: is not a link.\r\n"
+            b"\r\n"
+            b"## [1.0.0] - 2020-01-01\r\n"
+            b"### Added\r\n"
+            b"- Initial release.\r\n"
+            b"\r\n"
+            b"[Unreleased]: https://github.test_url/test_project/compare/v1.0.1...HEAD\r\n"
+            b"[1.0.1]: https://github.test_url/test_project/compare/v1.0.0...v1.0.1\r\n"
+            b"[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0\r\n"
+        )
+
+
+def test_release_only_modifies_unreleased_title_and_link(tmpdir, mock_date):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wb") as file:
+        file.write(
+            b"# Changelog  \n"
+            b"## [Unreleased]\n"
+            b"### Added\n"
+            b"- Trailing spaces are kept.   \n"
+            b"\n"
+            b"## [1.0.0] - 2020-01-01\n"
+            b"### Added\n"
+            b"- Initial release.\n"
+            b"\n"
+            b"[Unreleased]: https://github.test_url/test_project/compare/v1.0.0...HEAD"
+        )
+
+    assert keepachangelog.release(changelog_file_path) == "1.1.0"
+    with open(changelog_file_path, mode="rb") as file:
+        assert file.read() == (
+            b"# Changelog  \n"
+            b"## [Unreleased]\n"
+            b"\n"
+            b"## [1.1.0] - 2021-03-19\n"
+            b"### Added\n"
+            b"- Trailing spaces are kept.   \n"
+            b"\n"
+            b"## [1.0.0] - 2020-01-01\n"
+            b"### Added\n"
+            b"- Initial release.\n"
+            b"\n"
+            b"[Unreleased]: https://github.test_url/test_project/compare/v1.1.0...HEAD\n"
+            b"[1.1.0]: https://github.test_url/test_project/compare/v1.0.0...v1.1.0"
+        )
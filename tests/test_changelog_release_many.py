@@ -0,0 +1,107 @@
+import os
+import os.path
+
+import pytest
+
+import keepachangelog
+from keepachangelog._versioning import InvalidSemanticVersion
+
+
+def write_changelog(path: str, unreleased: str) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            f"""# Changelog
+
+## [Unreleased]
+{unreleased}
+## [1.0.0] - 2020-01-01
+### Added
+- Initial release.
+
+[Unreleased]: https://github.test_url/test_project/compare/v1.0.0...HEAD
+[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0
+"""
+        )
+    return path
+
+
+@pytest.fixture
+def changelogs(tmpdir):
+    return [
+        write_changelog(
+            os.path.join(tmpdir, "major", "CHANGELOG.md"),
+            "### Removed\n- Feature.\n",
+        ),
+        write_changelog(
+            os.path.join(tmpdir, "patch", "CHANGELOG.md"), "### Fixed\n- Bug.\n"
+        ),
+        write_changelog(os.path.join(tmpdir, "unchanged", "CHANGELOG.md"), ""),
+    ]
+
+
+def test_release_many(changelogs):
+    assert keepachangelog.release_many(changelogs) == {
+        changelogs[0]: "2.0.0",
+        changelogs[1]: "1.0.1",
+        changelogs[2]: None,
+    }
+    with open(changelogs[0], encoding="utf-8") as file:
+        content = file.read()
+    assert "## [Unreleased]\n\n## [2.0.0] - " in content
+    assert (
+        "[2.0.0]: https://github.test_url/test_project/compare/v1.0.0...v2.0.0\n"
+        in content
+    )
+    assert keepachangelog.to_dict(changelogs[1]).keys() == {"1.0.1", "1.0.0"}
+
+
+def test_release_many_with_version(changelogs):
+    assert keepachangelog.release_many(
+        changelogs, "3.0.0", lock=True, max_workers=2
+    ) == {
+        changelogs[0]: "3.0.0",
+        changelogs[1]: "3.0.0",
+        changelogs[2]: "3.0.0",
+    }
+    for changelog in changelogs:
+        assert "3.0.0" in keepachangelog.to_dict(changelog)
+
+
+def test_release_many_failure_does_not_prevent_other_releases(changelogs, tmpdir):
+    missing_changelog = os.path.join(tmpdir, "missing", "CHANGELOG.md")
+    releases = keepachangelog.release_many([missing_changelog, *changelogs])
+
+    assert isinstance(releases.pop(missing_changelog), FileNotFoundError)
+    assert releases == {
+        changelogs[0]: "2.0.0",
+        changelogs[1]: "1.0.1",
+        changelogs[2]: None,
+    }
+
+
+def test_release_many_releases_a_changelog_once(changelogs):
+    assert keepachangelog.release_many([changelogs[1], changelogs[1]]) == {
+        changelogs[1]: "1.0.1"
+    }
+    assert keepachangelog.to_dict(changelogs[1]).keys() == {"1.0.1", "1.0.0"}
+
+
+def test_release_many_without_changelog():
+    assert keepachangelog.release_many([]) == {}
+
+
+def test_release_many_failure_message(changelogs, tmpdir):
+    invalid_changelog = os.path.join(tmpdir, "invalid", "CHANGELOG.md")
+    write_changelog(invalid_changelog, "### Fixed\n- Bug.\n")
+    with open(invalid_changelog, mode="at", encoding="utf-8") as file:
+        file.write("\n## [abc] - 2019-01-01\n")
+
+    error = keepachangelog.release_many([invalid_changelog])[invalid_changelog]
+
+    assert isinstance(error, InvalidSemanticVersion)
+    assert error.version == "abc"
+    assert (
+        str(error)
+        == "abc is not following semantic versioning. Check https://semver.org for more information."
+    )
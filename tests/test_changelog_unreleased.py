@@ -252,3 +252,13 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 [1.0.2]: https://github.test_url/test_project/compare/v1.0.1...v1.0.2
 """
     )
+
+
+def test_changelog_write_dict(changelog, tmpdir):
+    releases = keepachangelog.to_dict(changelog, show_unreleased=True)
+    written_changelog = os.path.join(tmpdir, "WRITTEN_CHANGELOG.md")
+    with open(written_changelog, mode="wt", encoding="utf-8") as file:
+        keepachangelog.write_dict(releases, file)
+
+    with open(written_changelog, encoding="utf-8") as file:
+        assert file.read() == keepachangelog.from_dict(releases)
@@ -1,4 +1,5 @@
 import os
+import sys
 
 import pytest
 
@@ -100,7 +101,10 @@ def test_print_help(changelog: str, capsys: pytest.CaptureFixture):
     captured = capsys.readouterr()
 
     assert captured.err == ""
-    assert "usage: keepachangelog [-h] [-v] {show,release} ..." in captured.out
+    assert (
+        "usage: keepachangelog [-h] [-v] {show,since,release,versions,serve} ..."
+        in captured.out
+    )
 
 
 def test_print_version(changelog: str, capsys: pytest.CaptureFixture):
@@ -129,6 +133,53 @@ def test_show_release_raw(changelog: str, capsys: pytest.CaptureFixture):
     )
 
 
+def test_show_releases_since(changelog: str, capsys: pytest.CaptureFixture):
+    cli(["since", "1.0.1", changelog])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert (
+        captured.out.strip()
+        == """## [1.2.0] - 2018-06-01
+### Changed
+- Release note 1.
+- Release note 2.
+### Added
+- Enhancement 1
+- sub enhancement 1
+- sub enhancement 2
+- Enhancement 2
+### Fixed
+- Bug fix 1
+- sub bug 1
+- sub bug 2
+- Bug fix 2
+### Security
+- Known issue 1
+- Known issue 2
+### Deprecated
+- Deprecated feature 1
+- Future removal 2
+
+## [1.1.0] - 2018-05-31
+### Changed
+- Enhancement 1 (1.1.0)
+- sub enhancement 1
+- sub enhancement 2
+- Enhancement 2 (1.1.0)"""
+    )
+
+
+def test_show_releases_since_latest(changelog: str, capsys: pytest.CaptureFixture):
+    cli(["since", "1.2.0", changelog])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert captured.out == ""
+
+
 def test_create_release_automatic_version(
     changelog: str, capsys: pytest.CaptureFixture
 ):
@@ -163,3 +214,151 @@ def test_create_release_specific_version(changelog: str, capsys: pytest.CaptureF
 
     assert captured.err == ""
     assert captured.out.strip() == "3.2.1"
+
+
+def test_show_release_raw_followed_by_release(
+    changelog: str, capsys: pytest.CaptureFixture
+):
+    cli(["show", "1.1.0", changelog])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert (
+        captured.out.strip()
+        == """### Changed
+- Enhancement 1 (1.1.0)
+- sub enhancement 1
+- sub enhancement 2
+- Enhancement 2 (1.1.0)"""
+    )
+
+
+def test_show_release_with_repeated_sections(tmpdir, capsys: pytest.CaptureFixture):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            """## [1.0.0] - 2017-04-10
+### Added
+- a
+
+## [1.0.0] - 2017-04-10
+### Fixed
+- b
+"""
+        )
+
+    cli(["show", "1.0.0", changelog_file_path])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert captured.out.strip() == "### Added\n- a\n### Fixed\n- b"
+
+
+def test_show_unknown_release(changelog: str, capsys: pytest.CaptureFixture):
+    with pytest.raises(SystemExit) as cm:
+        cli(["show", "0.0.1", changelog])
+    assert cm.value.code == 2
+
+    captured = capsys.readouterr()
+
+    assert captured.err == f"0.0.1 cannot be found in {changelog}."
+    assert captured.out == ""
+
+
+def test_show_release_without_content(
+    changelog_without_unreleased: str, capsys: pytest.CaptureFixture
+):
+    with open(changelog_without_unreleased, mode="at", encoding="utf-8") as file:
+        file.write("\n## [1.0.1] - 2017-04-11\n")
+
+    cli(["show", "1.0.1", changelog_without_unreleased])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert captured.out == "\n"
+
+
+def test_create_locked_release(changelog: str, capsys: pytest.CaptureFixture):
+    cli(["release", "--lock", "-f", changelog])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert captured.out.strip() == "2.0.0"
+
+
+@pytest.fixture
+def changelogs(changelog: str, tmpdir) -> str:
+    with open(changelog, encoding="utf-8") as file:
+        content = file.read()
+    for package in ("package1", "package2"):
+        os.makedirs(os.path.join(tmpdir, package))
+        with open(
+            os.path.join(tmpdir, package, "CHANGELOG.md"), mode="wt", encoding="utf-8"
+        ) as file:
+            file.write(content)
+    return os.path.join(tmpdir, "*", "CHANGELOG.md")
+
+
+def test_release_all(changelogs: str, tmpdir, capsys: pytest.CaptureFixture):
+    cli(["release", "--all", changelogs])
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert captured.out == (
+        f"{os.path.join(tmpdir, 'package1', 'CHANGELOG.md')}: 2.0.0\n"
+        f"{os.path.join(tmpdir, 'package2', 'CHANGELOG.md')}: 2.0.0\n"
+        "2 released, 0 unchanged, 0 failed.\n"
+    )
+
+
+def test_release_all_with_failure(
+    changelogs: str, tmpdir, capsys: pytest.CaptureFixture
+):
+    with open(os.path.join(tmpdir, "package1", "CHANGELOG.md"), mode="wb") as file:
+        file.write(b"## [Unreleased]\n### Fixed\n- \xff\n")
+    os.makedirs(os.path.join(tmpdir, "package3"))
+    with open(
+        os.path.join(tmpdir, "package3", "CHANGELOG.md"), mode="wt", encoding="utf-8"
+    ) as file:
+        file.write("## [1.0.0] - 2020-01-01\n### Fixed\n- Bug\n")
+
+    with pytest.raises(SystemExit) as cm:
+        cli(["release", "--all", changelogs])
+
+    assert cm.value.code == 2
+    captured = capsys.readouterr()
+    assert captured.err.startswith(
+        f"{os.path.join(tmpdir, 'package1', 'CHANGELOG.md')}: UnicodeDecodeError: "
+    )
+    assert captured.out == (
+        f"{os.path.join(tmpdir, 'package2', 'CHANGELOG.md')}: 2.0.0\n"
+        f"{os.path.join(tmpdir, 'package3', 'CHANGELOG.md')}: nothing to release\n"
+        "1 released, 1 unchanged, 1 failed.\n"
+    )
+
+
+def test_release_all_without_matching_changelog(tmpdir, capsys: pytest.CaptureFixture):
+    pattern = os.path.join(tmpdir, "**", "CHANGELOG.md")
+    with pytest.raises(SystemExit) as cm:
+        cli(["release", "--all", pattern])
+
+    assert cm.value.code == 2
+    captured = capsys.readouterr()
+    assert captured.err == f"No changelog matches {pattern}."
+
+
+def test_command_line_arguments(
+    changelog: str, capsys: pytest.CaptureFixture, monkeypatch
+):
+    monkeypatch.setattr(sys, "argv", ["keepachangelog", "versions", changelog])
+    cli()
+
+    captured = capsys.readouterr()
+
+    assert captured.err == ""
+    assert captured.out == "1.2.0\n1.1.0\n1.0.1\n1.0.0\n"
@@ -144,3 +144,43 @@ def test_changelog_endpoint_without_file():
         response = client.get("/changelog")
         assert response.status_code == 200
         assert response.json == {}
+
+
+def test_changelog_endpoint_with_modified_file(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    app = flask.Flask(__name__)
+    api = flask_restx.Api(app)
+    add_changelog_endpoint(api, changelog_file_path)
+    with app.test_client() as client:
+        assert set(client.get("/changelog").json) == {"1.0.0"}
+
+        with open(changelog_file_path, "at") as file:
+            file.write("## [0.0.1] - 2017-04-09\n")
+
+        assert set(client.get("/changelog").json) == {"1.0.0", "0.0.1"}
+
+
+def test_changelog_endpoint_with_etag(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    app = flask.Flask(__name__)
+    api = flask_restx.Api(app)
+    add_changelog_endpoint(api, changelog_file_path)
+    with app.test_client() as client:
+        response = client.get("/changelog")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+
+        response = client.get("/changelog", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+        response = client.get("/changelog", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+        assert set(response.json) == {"1.0.0"}
@@ -0,0 +1,85 @@
+import os.path
+import subprocess
+import sys
+
+import pytest
+
+import keepachangelog
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(imports: str) -> set[str]:
+    """
+    :return: Modules imported by the import statement, on a clean interpreter (without site modules).
+    """
+    imported = subprocess.run(
+        [
+            sys.executable,
+            "-S",
+            "-c",
+            f"""import sys
+sys.path.insert(0, {root_dir!r})
+loaded = set(sys.modules)
+{imports}
+print(*sorted(set(sys.modules) - loaded))""",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(imported.stdout.split())
+
+
+def test_import_does_not_load_public_api():
+    # Import used to take ~50ms when the whole public API (and typing, re, ...) was imported
+    assert imported_modules("import keepachangelog") == {
+        "keepachangelog",
+        "keepachangelog.version",
+    }
+
+
+def test_command_line_import_does_not_load_public_api():
+    # Only modules required to parse the command line are imported
+    assert imported_modules("import keepachangelog.__main__") - imported_modules(
+        "import argparse, os, signal"
+    ) == {
+        "keepachangelog",
+        "keepachangelog.version",
+        "keepachangelog._client",
+        "keepachangelog.__main__",
+    }
+
+
+def test_public_api():
+    assert sorted(keepachangelog.__all__) == [
+        "Changelog",
+        "IncrementalParser",
+        "SemanticVersion",
+        "VersionIndex",
+        "__version__",
+        "bytes_to_dict",
+        "find_raw_release",
+        "from_dict",
+        "iter_raw_releases",
+        "iter_releases",
+        "parallel_to_dict",
+        "release",
+        "release_many",
+        "to_dict",
+        "to_raw_dict",
+        "to_sorted_semantic",
+        "write_dict",
+    ]
+    assert set(keepachangelog.__all__) <= set(dir(keepachangelog))
+    for name in keepachangelog.__all__:
+        assert getattr(keepachangelog, name) is not None
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError) as exception_info:
+        keepachangelog.unknown
+    assert (
+        str(exception_info.value)
+        == "module 'keepachangelog' has no attribute 'unknown'"
+    )
@@ -0,0 +1,209 @@
+import os
+import os.path
+import socket
+import threading
+
+import pytest
+
+import keepachangelog._client
+import keepachangelog._server
+from keepachangelog.__main__ import main as cli
+
+
+@pytest.fixture
+def changelog(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, mode="wt", encoding="utf-8") as file:
+        file.write(
+            """# Changelog
+
+## [Unreleased]
+### Fixed
+- Bug fix
+
+## [1.0.0] - 2017-04-10
+### Deprecated
+- Known issue 1 (1.0.0)
+
+[Unreleased]: https://github.test_url/test_project/compare/v1.0.0...HEAD
+[1.0.0]: https://github.test_url/test_project/releases/tag/v1.0.0
+"""
+        )
+    return changelog_file_path
+
+
+@pytest.fixture
+def socket_path(tmpdir, monkeypatch) -> str:
+    socket_path = os.path.join(tmpdir, "keepachangelog.sock")
+    monkeypatch.setenv("KEEPACHANGELOG_SOCKET", socket_path)
+    return socket_path
+
+
+@pytest.fixture
+def server(socket_path):
+    with keepachangelog._server.Server(socket_path) as server:
+        serving = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}
+        )
+        serving.start()
+        yield server
+        server.shutdown()
+        serving.join()
+
+
+def test_show(changelog, server, capsys):
+    cli(["show", "1.0.0", changelog])
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out == "### Deprecated\n- Known issue 1 (1.0.0)\n\n"
+    # Changelog was parsed by the server
+    assert list(server.changelogs) == [changelog]
+
+
+def test_show_relative_to_client_working_directory(
+    changelog, server, capsys, monkeypatch, tmpdir
+):
+    monkeypatch.chdir(tmpdir)
+    cli(["show", "1.0.0"])
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out == "### Deprecated\n- Known issue 1 (1.0.0)\n\n"
+
+
+def test_show_unknown_release(changelog, server, capsys):
+    with pytest.raises(SystemExit) as cm:
+        cli(["show", "0.0.1", changelog])
+
+    assert cm.value.code == 2
+    captured = capsys.readouterr()
+    assert captured.err == f"0.0.1 cannot be found in {changelog}."
+    assert captured.out == ""
+
+
+def test_versions(changelog, server, capsys):
+    cli(["versions", changelog])
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out == "1.0.0\n"
+
+
+def test_release_then_show(changelog, server, capsys):
+    cli(["show", "1.0.0", changelog])
+    cli(["release", "-f", changelog])
+    cli(["show", "1.0.1", changelog])
+    cli(["versions", changelog])
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out == (
+        "### Deprecated\n- Known issue 1 (1.0.0)\n\n"
+        "1.0.1\n"
+        "### Fixed\n- Bug fix\n\n"
+        "1.0.1\n1.0.0\n"
+    )
+
+
+def test_failure(server, capsys, tmpdir):
+    with pytest.raises(SystemExit) as cm:
+        cli(["release", "-f", os.path.join(tmpdir, "MISSING.md")])
+
+    assert cm.value.code == 1
+    captured = capsys.readouterr()
+    assert captured.err.startswith("FileNotFoundError: ")
+
+
+def test_serve_cannot_be_requested_to_server(server, socket_path, capsys):
+    assert keepachangelog._server.Server.run(
+        server, ["serve", "--socket", "other"], "."
+    ) == {
+        "stdout": "",
+        "stderr": "serve cannot be requested to a running server.",
+        "exit_code": 2,
+    }
+
+
+def test_commands_are_run_locally_without_server(changelog, socket_path, capsys):
+    cli(["versions", changelog])
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out == "1.0.0\n"
+
+
+def test_socket_is_only_accessible_by_user(server, socket_path):
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+
+def test_socket_is_created_only_accessible_by_user(socket_path):
+    previous_umask = os.umask(0)
+    try:
+        bound_modes = []
+
+        class Server(keepachangelog._server.Server):
+            def server_bind(self):
+                super().server_bind()
+                bound_modes.append(os.stat(socket_path).st_mode & 0o777)
+
+        with Server(socket_path):
+            pass
+        # Umask is restored
+        assert os.umask(0) == 0
+    finally:
+        os.umask(previous_umask)
+    assert bound_modes == [0o600]
+
+
+def test_server_not_answering(changelog, socket_path, monkeypatch, capsys):
+    monkeypatch.setattr(keepachangelog._client, "timeout", 0.05)
+    # Connection is accepted (by the system) but nothing is answered
+    with socket.socket(socket.AF_UNIX) as stopped_server:
+        stopped_server.bind(socket_path)
+        stopped_server.listen()
+
+        with pytest.raises(SystemExit) as exception_info:
+            cli(["versions", changelog])
+
+    assert exception_info.value.code == 2
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert (
+        captured.err
+        == f"Server listening on {socket_path} did not answer within 0.05 seconds."
+    )
+
+
+def test_socket_already_used(server, socket_path):
+    with pytest.raises(OSError) as exception_info:
+        keepachangelog._server.Server(socket_path)
+    assert (
+        str(exception_info.value)
+        == f"{socket_path} is already used by a running server."
+    )
+
+
+def test_stale_socket_is_replaced(changelog, socket_path, capsys):
+    with socket.socket(socket.AF_UNIX) as stale:
+        stale.bind(socket_path)
+
+    with keepachangelog._server.Server(socket_path) as server:
+        assert server.run(["versions", changelog], ".") == {
+            "stdout": "1.0.0\n",
+            "stderr": "",
+            "exit_code": 0,
+        }
+
+
+def test_serve(socket_path, capsys, monkeypatch):
+    monkeypatch.setattr(
+        keepachangelog._server.Server, "serve_forever", lambda server: None
+    )
+    cli(["serve", "--socket", socket_path])
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out == f"Serving on {socket_path}\n"
+    # Socket is removed once server is stopped
+    assert not os.path.exists(socket_path)
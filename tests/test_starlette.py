@@ -1,9 +1,15 @@
+import asyncio
 import os
+import threading
 
+import httpx
 from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.testclient import TestClient
 
+import keepachangelog
+import keepachangelog._incremental
+import keepachangelog.starlette
 from keepachangelog.starlette import changelog_endpoint
 
 
@@ -145,3 +151,146 @@ def test_changelog_endpoint_without_file():
         response = client.get("/changelog")
         assert response.status_code == 200
         assert response.json() == {}
+
+
+def test_changelog_endpoint_with_modified_file(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    changelog_route = Route(
+        "/changelog", endpoint=changelog_endpoint(changelog_file_path)
+    )
+    app = Starlette(routes=[changelog_route])
+    with TestClient(app) as client:
+        assert list(client.get("/changelog").json()) == ["1.0.0"]
+
+        with open(changelog_file_path, "at") as file:
+            file.write("## [0.0.1] - 2017-04-09\n")
+
+        assert list(client.get("/changelog").json()) == ["1.0.0", "0.0.1"]
+
+
+def test_changelog_endpoint_with_etag(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    changelog_route = Route(
+        "/changelog", endpoint=changelog_endpoint(changelog_file_path)
+    )
+    app = Starlette(routes=[changelog_route])
+    with TestClient(app) as client:
+        response = client.get("/changelog")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+
+        response = client.get("/changelog", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        response = client.get(
+            "/changelog", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+        assert response.status_code == 304
+
+        response = client.get("/changelog", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
+        response = client.get("/changelog", headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+        assert list(response.json()) == ["1.0.0"]
+
+        with open(changelog_file_path, "at") as file:
+            file.write("## [0.0.1] - 2017-04-09\n")
+
+        response = client.get("/changelog", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert list(response.json()) == ["1.0.0", "0.0.1"]
+
+
+def test_changelog_endpoint_concurrent_requests(tmpdir, monkeypatch):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    parsing_threads = []
+
+    parser_to_dict = keepachangelog._incremental.IncrementalParser.to_dict
+
+    def to_dict(self, content):
+        parsing_threads.append(threading.current_thread())
+        return parser_to_dict(self, content)
+
+    monkeypatch.setattr(
+        keepachangelog._incremental.IncrementalParser, "to_dict", to_dict
+    )
+
+    changelog_route = Route(
+        "/changelog", endpoint=changelog_endpoint(changelog_file_path)
+    )
+    app = Starlette(routes=[changelog_route])
+
+    async def get_changelog_concurrently():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await asyncio.gather(*[client.get("/changelog") for _ in range(20)])
+
+    responses = asyncio.run(get_changelog_concurrently())
+    assert [response.status_code for response in responses] == [200] * 20
+    assert [list(response.json()) for response in responses] == [["1.0.0"]] * 20
+    # Parsing was performed once, outside of the event loop thread
+    assert len(parsing_threads) == 1
+    assert parsing_threads[0] is not threading.current_thread()
+
+
+def test_changelog_endpoint_unchanged_changelog_is_not_read_again(tmpdir, monkeypatch):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    threadpool_calls = []
+
+    async def run_in_threadpool(func, *args, **kwargs):
+        threadpool_calls.append(func)
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(
+        keepachangelog.starlette, "run_in_threadpool", run_in_threadpool
+    )
+
+    changelog_route = Route(
+        "/changelog", endpoint=changelog_endpoint(changelog_file_path)
+    )
+    with TestClient(Starlette(routes=[changelog_route])) as client:
+        for _ in range(3):
+            response = client.get("/changelog")
+            assert response.status_code == 200
+            assert list(response.json()) == ["1.0.0"]
+        # Requests on an unchanged changelog are answered within the event loop
+        assert len(threadpool_calls) == 1
+
+        with open(changelog_file_path, "at") as file:
+            file.write("## [0.0.1] - 2017-04-09\n")
+
+        response = client.get("/changelog")
+        assert list(response.json()) == ["1.0.0", "0.0.1"]
+        assert len(threadpool_calls) == 2
+
+
+def test_changelog_endpoint_without_file_after_removal(tmpdir):
+    changelog_file_path = os.path.join(tmpdir, "CHANGELOG.md")
+    with open(changelog_file_path, "wt") as file:
+        file.write("## [1.0.0] - 2017-04-10\n")
+
+    changelog_route = Route(
+        "/changelog", endpoint=changelog_endpoint(changelog_file_path)
+    )
+    with TestClient(Starlette(routes=[changelog_route])) as client:
+        assert list(client.get("/changelog").json()) == ["1.0.0"]
+        os.remove(changelog_file_path)
+        assert client.get("/changelog").json() == {}
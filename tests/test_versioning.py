@@ -0,0 +1,232 @@
+import pytest
+
+import keepachangelog
+from keepachangelog._versioning import (
+    InvalidSemanticVersion,
+    SemanticVersion,
+    actual_version,
+    to_semantic,
+)
+
+versions = [
+    "10.0.0",
+    "2.10.0",
+    "2.9.1",
+    "2.9.1-rc1",
+    "2.9.1-beta",
+    "2.9.0",
+    "1.0.0",
+    "1.0.0-alpha",
+]
+
+
+def test_to_sorted_semantic():
+    assert [
+        version
+        for version, _ in keepachangelog.to_sorted_semantic(
+            list(reversed(versions)) + ["unreleased"]
+        )
+    ] == list(reversed(versions))
+
+
+def test_to_sorted_semantic_pre_releases():
+    # Example from https://semver.org/#spec-item-11
+    ordered_versions = [
+        "1.0.0-alpha",
+        "1.0.0-alpha.1",
+        "1.0.0-alpha.beta",
+        "1.0.0-beta",
+        "1.0.0-beta.2",
+        "1.0.0-beta.11",
+        "1.0.0-rc.1",
+        "1.0.0",
+    ]
+    assert [
+        version
+        for version, _ in keepachangelog.to_sorted_semantic(
+            list(reversed(ordered_versions))
+        )
+    ] == ordered_versions
+
+
+def test_numeric_pre_release_identifiers_are_compared_numerically():
+    assert [
+        version
+        for version, _ in keepachangelog.to_sorted_semantic(
+            ["1.0.0-rc.10", "1.0.0-rc.2", "1.0.0-rc.1"]
+        )
+    ] == ["1.0.0-rc.1", "1.0.0-rc.2", "1.0.0-rc.10"]
+    assert SemanticVersion.parse("1.0.0-rc.10") > SemanticVersion.parse("1.0.0-rc.2")
+
+
+def test_actual_version_with_numeric_pre_releases():
+    assert (
+        actual_version({"1.0.0-rc.10": {}, "1.0.0-rc.2": {}, "unreleased": {}})[0]
+        == "1.0.0-rc.10"
+    )
+
+
+def test_semantic_version_parse():
+    semantic_version = keepachangelog.SemanticVersion.parse("1.2.3-rc.1+build.5")
+    assert semantic_version.to_dict() == {
+        "major": 1,
+        "minor": 2,
+        "patch": 3,
+        "prerelease": "rc.1",
+        "buildmetadata": "build.5",
+    }
+    assert str(semantic_version) == "1.2.3-rc.1+build.5"
+    assert repr(semantic_version) == "SemanticVersion(1, 2, 3, 'rc.1', 'build.5')"
+    assert keepachangelog.SemanticVersion.parse(None) == (
+        keepachangelog.SemanticVersion(0, 0, 0)
+    )
+
+
+def test_semantic_version_invalid():
+    with pytest.raises(InvalidSemanticVersion) as exception_info:
+        keepachangelog.SemanticVersion.parse("20180531")
+    assert (
+        str(exception_info.value)
+        == "20180531 is not following semantic versioning. Check https://semver.org for more information."
+    )
+
+
+def test_semantic_version_is_immutable():
+    semantic_version = keepachangelog.SemanticVersion(1, 2, 3)
+    with pytest.raises(AttributeError):
+        semantic_version.major = 2
+    with pytest.raises(AttributeError):
+        del semantic_version.major
+    assert semantic_version.major == 1
+
+
+def test_semantic_version_ordering():
+    semantic_versions = [
+        keepachangelog.SemanticVersion.parse(version) for version in versions
+    ]
+    assert sorted(semantic_versions) == list(reversed(semantic_versions))
+    assert semantic_versions[0] > semantic_versions[1]
+    assert semantic_versions[0] >= semantic_versions[1]
+    assert semantic_versions[1] < semantic_versions[0]
+    assert semantic_versions[1] <= semantic_versions[0]
+    assert semantic_versions[1] <= semantic_versions[1]
+    # Build metadata is not considered for precedence
+    assert keepachangelog.SemanticVersion.parse(
+        "1.0.0+build.1"
+    ) != keepachangelog.SemanticVersion.parse("1.0.0+build.2")
+    assert keepachangelog.SemanticVersion.parse(
+        "1.0.0+build.1"
+    ) <= keepachangelog.SemanticVersion.parse("1.0.0+build.2")
+    assert (
+        len({keepachangelog.SemanticVersion(1), keepachangelog.SemanticVersion(1)}) == 1
+    )
+    assert keepachangelog.SemanticVersion(1) != "1.0.0"
+    with pytest.raises(TypeError):
+        keepachangelog.SemanticVersion(1) < "1.0.0"
+    with pytest.raises(TypeError):
+        keepachangelog.SemanticVersion(1) <= "1.0.0"
+    with pytest.raises(TypeError):
+        keepachangelog.SemanticVersion(1) > "1.0.0"
+    with pytest.raises(TypeError):
+        keepachangelog.SemanticVersion(1) >= "1.0.0"
+
+
+def test_semantic_version_bump():
+    semantic_version = keepachangelog.SemanticVersion.from_dict(
+        {
+            "major": 1,
+            "minor": 2,
+            "patch": 3,
+            "prerelease": None,
+            "buildmetadata": "build.5",
+        }
+    )
+    assert semantic_version.bump_major() == keepachangelog.SemanticVersion(2)
+    assert semantic_version.bump_minor() == keepachangelog.SemanticVersion(1, 3)
+    assert semantic_version.bump_patch() == keepachangelog.SemanticVersion(1, 2, 4)
+    assert semantic_version.bump({"removed": []}) == keepachangelog.SemanticVersion(2)
+    assert semantic_version.bump({"fixed": []}) == keepachangelog.SemanticVersion(
+        1, 2, 4
+    )
+    assert semantic_version.bump({"added": []}) == keepachangelog.SemanticVersion(1, 3)
+    assert keepachangelog.SemanticVersion(1, 2, 3, "rc.1").bump(
+        {"removed": []}
+    ) == keepachangelog.SemanticVersion(1, 2, 3)
+    # Bumping does not modify the version
+    assert str(semantic_version) == "1.2.3+build.5"
+
+
+def test_semantic_version_parse_is_cached():
+    keepachangelog.SemanticVersion.parse.cache_clear()
+    semantic_version = keepachangelog.SemanticVersion.parse("4.5.6")
+    assert keepachangelog.SemanticVersion.parse("4.5.6") is semantic_version
+    cache_info = keepachangelog.SemanticVersion.parse.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+def test_to_semantic_cannot_modify_cache():
+    to_semantic("4.5.6")["major"] = 5
+    assert to_semantic("4.5.6")["major"] == 4
+
+
+@pytest.fixture
+def version_index():
+    changes = {
+        "unreleased": {"metadata": {"version": "unreleased", "release_date": None}},
+        **{version: {"metadata": {"version": version}} for version in versions},
+        "2.9.1+build": {"metadata": {"version": "2.9.1+build"}},
+    }
+    return keepachangelog.VersionIndex(changes)
+
+
+def test_version_index_since(version_index):
+    assert list(version_index.since("2.9.1")) == ["10.0.0", "2.10.0"]
+    assert list(version_index.since("2.9.2")) == ["10.0.0", "2.10.0"]
+    assert list(version_index.since("2.9.1-beta")) == [
+        "10.0.0",
+        "2.10.0",
+        "2.9.1+build",
+        "2.9.1",
+        "2.9.1-rc1",
+    ]
+    assert list(version_index.since("10.0.0")) == []
+    assert len(version_index.since("0.0.1")) == len(version_index) == 9
+
+
+def test_version_index_between(version_index):
+    assert list(version_index.between("1.0.0", "2.9.1-beta")) == [
+        "2.9.1-beta",
+        "2.9.0",
+        "1.0.0",
+    ]
+    assert list(version_index.between("1.0.1", "2.9.2")) == [
+        "2.9.1+build",
+        "2.9.1",
+        "2.9.1-rc1",
+        "2.9.1-beta",
+        "2.9.0",
+    ]
+    assert list(version_index.between("3.0.0", "9.0.0")) == []
+    assert version_index.between("2.10.0", "2.10.0") == {
+        "2.10.0": {"metadata": {"version": "2.10.0"}}
+    }
+
+
+def test_version_index_latest(version_index):
+    assert list(version_index.latest(2)) == ["10.0.0", "2.10.0"]
+    assert list(version_index.latest(0)) == []
+    assert len(version_index.latest(20)) == 9
+
+
+def test_version_index_latest_in_major(version_index):
+    assert version_index.latest_in_major(2) == {"metadata": {"version": "2.10.0"}}
+    assert version_index.latest_in_major(1) == {"metadata": {"version": "1.0.0"}}
+    assert version_index.latest_in_major(10) == {"metadata": {"version": "10.0.0"}}
+    assert version_index.latest_in_major(0) is None
+    assert version_index.latest_in_major(3) is None
+    assert version_index.latest_in_major(11) is None
+
+
+def test_version_index_invalid_version():
+    with pytest.raises(InvalidSemanticVersion):
+        keepachangelog.VersionIndex({"abc": {"metadata": {"version": "abc"}}})